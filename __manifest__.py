@@ -5,7 +5,7 @@
 
 {
     "name": "RANCS Capital Real Estate",
-    "version": "19.0.1.0.0",
+    "version": "19.0.1.1.0",
     "category": "Real Estate/Brokerage",
     "summary": "Real Estate Property Management & Investment Tracking for RANCS Capital",
     "description": """
@@ -45,12 +45,17 @@ Built for RANCS Capital LLC.
         "data/estate_property_type_data.xml",
         "data/estate_property_tag_data.xml",
         "data/estate_property_utility_data.xml",
+        "data/estate_cron.xml",
+        "data/estate_server_actions.xml",
         # Views - load related models first
         "views/estate_property_stage_views.xml",
         "views/estate_property_type_views.xml",
         "views/estate_property_tag_views.xml",
         "views/estate_property_utility_views.xml",
         "views/estate_property_offer_views.xml",
+        "views/estate_property_inquiry_views.xml",
+        "views/estate_postcode_centroid_views.xml",
+        "views/estate_pipeline_rollup_views.xml",
         "views/estate_property_views.xml",
         "views/res_users_views.xml",
         "views/estate_property_website.xml",
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""Hammer one property with concurrent offers and acceptances from threads.
+
+    python3 -m benchmarks.bench_concurrent_offers -c odoo.conf -d estate_bench --threads 8 --offers 50
+
+Run from the module directory with Odoo importable. Unlike the other
+scripts, the threads must commit to see each other's offers: the script
+creates its own buyer and property, and deletes them at the end.
+
+Every thread outbids the current best offer in a loop, and one acceptance
+is attempted per thread at the end. The run fails unless the committed
+offers are strictly increasing, ``best_price`` and ``offer_count`` match
+them and at most one offer is accepted; conflicts must surface as
+immediate lock errors or rejected bids, never as lost updates.
+"""
+
+import random
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+from .common import build_parser, load_registry, report
+
+
+def classify(exc):
+    from psycopg2 import errors
+
+    if isinstance(exc.__cause__, errors.LockNotAvailable):
+        return "lock_conflicts"
+    if isinstance(exc, errors.SerializationFailure):
+        return "serialization_failures"
+    return "rejected"
+
+
+def setup(registry):
+    from odoo import SUPERUSER_ID, api
+
+    with registry.cursor() as cr:
+        env = api.Environment(cr, SUPERUSER_ID, {"tracking_disable": True})
+        buyer = env["res.partner"].create({"name": "Benchmark concurrent buyer"})
+        property_obj = env["estate.property"].create(
+            {"name": "Benchmark concurrent offers", "expected_price": 100000}
+        )
+        return property_obj.id, buyer.id
+
+
+def teardown(registry, property_id, buyer_id):
+    from odoo import SUPERUSER_ID, api
+
+    with registry.cursor() as cr:
+        env = api.Environment(cr, SUPERUSER_ID, {})
+        property_obj = env["estate.property"].browse(property_id)
+        property_obj.action_cancel()
+        property_obj.unlink()
+        env["res.partner"].browse(buyer_id).unlink()
+
+
+def worker(registry, property_id, buyer_id, offers, outcomes, queries, lock):
+    from odoo import SUPERUSER_ID, api
+    from odoo.exceptions import UserError
+    from psycopg2 import errors
+
+    def attempt(action):
+        with registry.cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {"tracking_disable": True})
+            start = cr.sql_log_count
+            try:
+                action(env)
+                cr.commit()
+                outcome = "succeeded"
+            except (UserError, errors.SerializationFailure) as e:
+                cr.rollback()
+                outcome = classify(e)
+            with lock:
+                outcomes[outcome] += 1
+                queries[0] += cr.sql_log_count - start
+
+    def bid(env):
+        property_obj = env["estate.property"].browse(property_id)
+        price = property_obj.best_price + random.randint(1, 1000) if property_obj.best_price else 100000
+        env["estate.property.offer"].create(
+            {"property_id": property_id, "partner_id": buyer_id, "price": price}
+        )
+
+    def accept(env):
+        best = env["estate.property.offer"].search(
+            [("property_id", "=", property_id), ("state", "=", "pending")],
+            order="price desc",
+            limit=1,
+        )
+        if best:
+            best.action_accept()
+
+    for _ in range(offers):
+        attempt(bid)
+    attempt(accept)
+
+
+def check(registry, property_id):
+    from odoo import SUPERUSER_ID, api
+
+    with registry.cursor() as cr:
+        env = api.Environment(cr, SUPERUSER_ID, {})
+        cr.execute(
+            "SELECT price, state FROM estate_property_offer WHERE property_id = %s ORDER BY id",
+            [property_id],
+        )
+        rows = cr.fetchall()
+        prices = [price for price, _state in rows]
+        if any(later <= earlier for earlier, later in zip(prices, prices[1:])):
+            raise AssertionError(f"Offers are not strictly increasing: {prices}")
+        accepted = sum(1 for _price, state in rows if state == "accepted")
+        if accepted > 1:
+            raise AssertionError(f"{accepted} offers accepted on one property")
+        property_obj = env["estate.property"].browse(property_id)
+        if property_obj.offer_count != len(rows) or property_obj.best_price != max(prices, default=0):
+            raise AssertionError(
+                f"Stored offer stats out of date: best_price {property_obj.best_price}, "
+                f"offer_count {property_obj.offer_count}, expected {max(prices, default=0)} "
+                f"and {len(rows)}"
+            )
+        return len(rows), accepted
+
+
+def run(registry, threads, offers):
+    property_id, buyer_id = setup(registry)
+    outcomes = Counter()
+    queries = [0]
+    lock = threading.Lock()
+    try:
+        tracemalloc.start()
+        start = time.perf_counter()
+        workers = [
+            threading.Thread(
+                target=worker,
+                args=(registry, property_id, buyer_id, offers, outcomes, queries, lock),
+            )
+            for _ in range(threads)
+        ]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        wall_time = time.perf_counter() - start
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        offer_count, accepted = check(registry, property_id)
+    finally:
+        teardown(registry, property_id, buyer_id)
+    return [
+        dict(
+            outcomes,
+            name="concurrent_offers",
+            threads=threads,
+            attempts=threads * (offers + 1),
+            offers_committed=offer_count,
+            offers_accepted=accepted,
+            wall_time=round(wall_time, 6),
+            queries=queries[0],
+            peak_memory=peak_memory,
+        )
+    ]
+
+
+def main():
+    parser = build_parser(__doc__)
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent threads")
+    parser.add_argument("--offers", type=int, default=50, help="Bids per thread")
+    args = parser.parse_args()
+    registry = load_registry(args)
+    results = run(registry, args.threads, args.offers)
+    for key in ("succeeded", "lock_conflicts", "rejected", "serialization_failures"):
+        print(f"{key:<24} {results[0].get(key, 0)}")
+    report(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Compare the SQL bulk recompute of investment fields with the ORM computes.
+
+    python3 -m benchmarks.bench_investment_recompute -c odoo.conf -d estate_bench --size 100000
+
+Run from the module directory with Odoo importable. Both variants update the
+inputs of the same number of identical properties, then the stored results
+are compared. Everything is rolled back.
+"""
+
+from .common import build_parser, measure, odoo_env, report
+
+CREATE_BATCH_SIZE = 1000
+# The bulk update whose recompute is measured.
+UPDATE_VALUES = {"rehab_cost": 25000.0, "monthly_rent": 1850.0, "garden_area": 120}
+RESULT_COLUMNS = (
+    "total_area",
+    "potential_profit",
+    "roi_percentage",
+    "monthly_cash_flow",
+    "annual_cash_flow",
+    "cap_rate",
+)
+
+
+def create_properties(env, size, label):
+    """Create ``size`` properties with varied inputs (set-based, unmeasured)."""
+    Property = env["estate.property"].with_context(
+        estate_bulk_recompute=True, tracking_disable=True, mail_create_nolog=True
+    )
+    ids = []
+    for start in range(0, size, CREATE_BATCH_SIZE):
+        ids += Property.create(
+            [
+                {
+                    "name": f"Benchmark {label} {index}",
+                    "expected_price": 100000 + index,
+                    "purchase_price": 80000 + index % 5000 * 10,
+                    "arv": 150000 + index % 7000 * 10,
+                    "closing_costs": 3000 + index % 100,
+                    "monthly_expenses": 400 + index % 300,
+                    "living_area": 800 + index % 2000,
+                    "garden_area": index % 500,
+                }
+                for index in range(start, min(start + CREATE_BATCH_SIZE, size))
+            ]
+        ).ids
+        env.invalidate_all()
+    return env["estate.property"].browse(ids)
+
+
+def stored_results(env, properties):
+    env.cr.execute(
+        f"SELECT {', '.join(RESULT_COLUMNS)} FROM estate_property WHERE id = ANY(%s) ORDER BY id",
+        [properties.ids],
+    )
+    return env.cr.fetchall()
+
+
+def check_same_results(orm_rows, bulk_rows):
+    for orm_row, bulk_row in zip(orm_rows, bulk_rows, strict=True):
+        for column, orm_value, bulk_value in zip(RESULT_COLUMNS, orm_row, bulk_row):
+            if abs((orm_value or 0) - (bulk_value or 0)) > 1e-6:
+                raise AssertionError(
+                    f"{column} differs: ORM {orm_value!r}, bulk SQL {bulk_value!r}"
+                )
+
+
+def run(env, size):
+    results = []
+    orm_properties = create_properties(env, size, "orm")
+    bulk_properties = create_properties(env, size, "bulk")
+
+    with measure(env, "investment_recompute.orm", results, size=size):
+        orm_properties.write(UPDATE_VALUES)
+    env.invalidate_all()
+
+    with measure(env, "investment_recompute.bulk_sql", results, size=size):
+        bulk_properties.with_context(estate_bulk_recompute=True).write(UPDATE_VALUES)
+    env.invalidate_all()
+
+    check_same_results(stored_results(env, orm_properties), stored_results(env, bulk_properties))
+    return results
+
+
+def main():
+    parser = build_parser(__doc__)
+    parser.add_argument("--size", type=int, default=100000, help="Properties per variant")
+    args = parser.parse_args()
+    with odoo_env(args) as env:
+        results = run(env, args.size)
+    report(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
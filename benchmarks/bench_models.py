@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""Measure the key model methods on an existing portfolio.
+
+    python3 -m benchmarks.bench_models -c odoo.conf -d estate_bench --size 1000 -o models.json
+
+Run from the module directory with Odoo importable, against a database
+filled by ``benchmarks.datagen``. Each case works on ``--size`` existing
+properties or offers; everything is rolled back, including the offer expiry
+cron, whose batch commits are turned into flushes.
+"""
+
+from unittest.mock import patch
+
+from .common import build_parser, measure, odoo_env, report
+
+FULLTEXT_QUERY = "pool garage"
+# Downtown Dallas, where the generator scatters part of the portfolio.
+CENTER = (32.7767, -96.7970)
+RADIUS_KM = 10
+BBOX = (32.6, -97.0, 32.9, -96.6)
+SCENARIOS = {
+    "rates_up": {"rate_delta": 1},
+    "rehab_overrun": {"rehab_cost_pct": 15},
+    "rent_drop": {"monthly_rent_pct": -10},
+}
+
+
+def sample_properties(env, domain, size):
+    properties = env["estate.property"].search(domain, order="id", limit=size)
+    if not properties:
+        raise SystemExit("No matching property: generate data with benchmarks.datagen first.")
+    return properties
+
+
+def bench_offers(env, results, size):
+    properties = sample_properties(env, [("state", "in", ("new", "offer_received"))], size)
+    buyer = env["res.partner"].create({"name": "Benchmark buyer"})
+    vals_list = [
+        {
+            "property_id": property_obj.id,
+            "partner_id": buyer.id,
+            "price": max(property_obj.best_price, property_obj.expected_price) + 1000,
+        }
+        for property_obj in properties
+    ]
+    env.invalidate_all()
+    with measure(env, "offer.create.batch", results, size=len(vals_list)):
+        offers = env["estate.property.offer"].create(vals_list)
+    env.invalidate_all()
+    with measure(env, "offer.create.single", results, size=1):
+        env["estate.property.offer"].create(
+            {"property_id": offers[0].property_id.id, "partner_id": buyer.id, "price": offers[0].price + 1000}
+        )
+    with measure(env, "offer.action_accept", results, size=1):
+        offers[-1].action_accept()
+
+
+def bench_kanban(env, results):
+    Property = env["estate.property"]
+    env.invalidate_all()
+    with measure(env, "property.kanban.read_group", results):
+        groups = Property._read_group([], ["stage_id"], ["__count"])
+        Property._read_group_stage_ids(env["estate.property.stage"].browse(), [])
+    with measure(env, "property.kanban.first_column", results, groups=len(groups)):
+        Property.search_fetch(
+            [("stage_id", "=", groups[0][0].id)] if groups else [],
+            ["name", "expected_price", "best_price", "tag_ids", "property_type_id"],
+            limit=80,
+        )
+
+
+def bench_recompute(env, results, size):
+    properties = sample_properties(env, [], size)
+    env.invalidate_all()
+    with measure(env, "property.bulk_recompute", results, size=len(properties)):
+        properties._bulk_recompute_investment_fields()
+
+
+def bench_search(env, results):
+    Property = env["estate.property"]
+    published = [("website_published", "=", True)]
+    env.invalidate_all()
+    with measure(env, "property.search.fulltext_ranked", results):
+        Property._search_fulltext_ranked(FULLTEXT_QUERY, published, limit=24)
+    with measure(env, "property.search.fulltext_domain", results):
+        Property.search_count(published + [("fulltext", "=", FULLTEXT_QUERY)])
+    with measure(env, "property.search.radius", results, radius_km=RADIUS_KM):
+        Property._search_radius(*CENTER, RADIUS_KM, published, limit=24)
+    with measure(env, "property.search.bbox", results):
+        Property._search_bbox(*BBOX, published, limit=24)
+
+
+def bench_analytics(env, results):
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("NumPy is not installed, portfolio analytics skipped")
+        return
+    env.invalidate_all()
+    with measure(env, "portfolio.analyze", results, scenarios=len(SCENARIOS) + 1):
+        env["estate.portfolio.analytics"]._analyze([], SCENARIOS)
+
+
+def bench_rollup(env, results, size):
+    Rollup = env["estate.pipeline.rollup"]
+    with measure(env, "pipeline_rollup.full", results):
+        Rollup._refresh(full=True)
+    properties = sample_properties(env, [], size)
+    properties.write({"expected_price": 250000})
+    with measure(env, "pipeline_rollup.incremental", results, size=len(properties)):
+        Rollup._refresh()
+
+
+def bench_expire(env, results, size):
+    env.cr.execute(
+        """
+        UPDATE estate_property_offer SET date_deadline = current_date - 1
+         WHERE id IN (SELECT id FROM estate_property_offer WHERE state = 'pending' ORDER BY id LIMIT %s)
+        """,
+        [size],
+    )
+    expired = env.cr.rowcount
+    env.invalidate_all()
+    # Outside a cron job, ir.cron._commit_progress commits each batch.
+    cursor_class = type(env.cr)
+    with patch.object(cursor_class, "commit", cursor_class.flush):
+        with measure(env, "offer.cron_expire", results, size=expired):
+            env["estate.property.offer"]._cron_expire_offers()
+
+
+def bench_geocode(env, results, size):
+    properties = sample_properties(env, [("postcode", "!=", False)], size)
+    env.invalidate_all()
+    with measure(env, "property.geocode", results, size=len(properties)):
+        properties._geocode()
+
+
+def run(env, size):
+    results = []
+    env = env(context=dict(env.context, tracking_disable=True, mail_create_nolog=True))
+    bench_kanban(env, results)
+    bench_search(env, results)
+    bench_analytics(env, results)
+    bench_recompute(env, results, size)
+    bench_geocode(env, results, size)
+    bench_offers(env, results, size)
+    bench_expire(env, results, size)
+    bench_rollup(env, results, size)
+    return results
+
+
+def main():
+    parser = build_parser(__doc__)
+    parser.add_argument("--size", type=int, default=1000, help="Records per case")
+    args = parser.parse_args()
+    with odoo_env(args) as env:
+        results = run(env, args.size)
+    report(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
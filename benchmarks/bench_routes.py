@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""Measure the public website routes in-process, without a running server.
+
+    python3 -m benchmarks.bench_routes -c odoo.conf -d estate_bench --repeat 20 -o routes.json
+
+Run from the module directory with Odoo importable, against a database with
+published properties (see ``benchmarks.datagen``). Requests go through the
+full WSGI stack (``odoo.http.root``) with a werkzeug test client, so routing,
+sessions, QWeb rendering and the render cache are all included. Query counts
+come from the thread counter the HTTP layer logs for every request.
+
+The inquiry POSTs create inquiries, which the script deletes at the end.
+"""
+
+import re
+import statistics
+import threading
+import time
+import tracemalloc
+
+from .common import build_parser, load_registry, report
+
+CSRF_TOKEN_RE = re.compile(r'name="csrf_token"\s+value="([^"]+)"')
+INQUIRY_NAME = "Benchmark visitor"
+
+
+def sample_listing(registry):
+    """Return sample published properties and listing parameters."""
+    from odoo import SUPERUSER_ID, api
+
+    with registry.cursor() as cr:
+        env = api.Environment(cr, SUPERUSER_ID, {})
+        properties = env["estate.property"].search(
+            [("website_published", "=", True), ("active", "=", True)],
+            limit=50,
+        )
+        if not properties:
+            raise SystemExit("No published property: generate data with benchmarks.datagen first.")
+        located = properties.filtered("geohash")[:1]
+        return {
+            "urls": properties.mapped("website_url"),
+            "middle_id": properties[len(properties) // 2].id,
+            "type_id": properties[0].property_type_id.id,
+            "near": f"{located.latitude},{located.longitude},10" if located else None,
+        }
+
+
+def make_client():
+    from odoo.http import root
+    from werkzeug.test import Client
+
+    return Client(root)
+
+
+def timed_request(client, method, url, runs, **kwargs):
+    """Run a request ``runs`` times; return the timings, the query count and
+    the peak memory of the runs, and the last response."""
+    timings = []
+    queries = []
+    tracemalloc.start()
+    thread = threading.current_thread()
+    response = None
+    for _ in range(runs):
+        thread.query_count = 0
+        start = time.perf_counter()
+        response = client.open(url, method=method, **kwargs)
+        response.get_data()
+        timings.append(time.perf_counter() - start)
+        queries.append(thread.query_count)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return timings, queries, peak_memory, response
+
+
+def record(results, name, timings, queries, peak_memory, response, **extra):
+    ordered = sorted(timings)
+    results.append(
+        dict(
+            extra,
+            name=name,
+            status=response.status_code,
+            runs=len(timings),
+            wall_time=round(statistics.median(timings), 6),
+            wall_time_p95=round(ordered[max(0, int(len(ordered) * 0.95) - 1)], 6),
+            queries=max(queries),
+            peak_memory=peak_memory,
+        )
+    )
+
+
+def run(registry, repeat):
+    sample = sample_listing(registry)
+    client = make_client()
+    results = []
+
+    get_routes = [
+        ("route.properties", "/properties"),
+        ("route.properties.after", f"/properties?after={sample['middle_id']}"),
+        ("route.properties.type", f"/properties?type_id={sample['type_id']}"),
+        ("route.properties.filters", "/properties?min_price=200000&max_price=600000&bedrooms=3"),
+        ("route.properties.fulltext", "/properties?q=pool"),
+        ("route.properties.facets", "/properties/facets"),
+        ("route.properties.json", "/properties/json?limit=100"),
+        ("route.properties.json.fields", "/properties/json?fields=name,city,latitude,longitude"),
+        ("route.sitemap", "/sitemap.xml"),
+    ]
+    if sample["near"]:
+        get_routes.append(("route.properties.near", f"/properties?near={sample['near']}"))
+    for name, url in get_routes:
+        record(results, name, *timed_request(client, "GET", url, repeat), url=url)
+
+    # Detail pages: first hit per property renders, later hits use the cache.
+    cold = []
+    cold_queries = []
+    tracemalloc.start()
+    for url in sample["urls"][:repeat]:
+        timings, queries, _peak, response = timed_request(client, "GET", url, 1)
+        cold += timings
+        cold_queries += queries
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    record(results, "route.property_detail.cold", cold, cold_queries, peak_memory, response)
+    url = sample["urls"][0]
+    record(results, "route.property_detail.cached", *timed_request(client, "GET", url, repeat), url=url)
+
+    # ETag revalidation of the JSON API.
+    response = client.get("/properties/json")
+    etag = response.headers.get("ETag")
+    if etag:
+        record(
+            results,
+            "route.properties.json.not_modified",
+            *timed_request(client, "GET", "/properties/json", repeat, headers={"If-None-Match": etag}),
+        )
+
+    # Inquiries: one per client IP and property, to stay under the rate limits.
+    match = CSRF_TOKEN_RE.search(client.get(url).get_data(as_text=True))
+    if match:
+        timings = []
+        queries = []
+        tracemalloc.start()
+        for index, property_url in enumerate((sample["urls"] * repeat)[:repeat]):
+            timing, query, _peak, response = timed_request(
+                client,
+                "POST",
+                f"{property_url}/inquiry",
+                1,
+                data={
+                    "csrf_token": match.group(1),
+                    "name": INQUIRY_NAME,
+                    "email": f"visitor{index}@example.com",
+                    "message": "Is it still available?",
+                },
+                environ_base={"REMOTE_ADDR": f"10.42.{index // 250}.{index % 250 + 1}"},
+            )
+            timings += timing
+            queries += query
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        record(results, "route.property_inquiry", timings, queries, peak_memory, response)
+    return results
+
+
+def cleanup(registry):
+    with registry.cursor() as cr:
+        cr.execute("DELETE FROM estate_property_inquiry WHERE name = %s", [INQUIRY_NAME])
+
+
+def main():
+    parser = build_parser(__doc__)
+    parser.add_argument("--repeat", type=int, default=20, help="Requests per route")
+    args = parser.parse_args()
+    from odoo.service import server
+    from odoo.tools import config
+
+    registry = load_registry(args)
+    config["db_name"] = args.database
+    server.load_server_wide_modules()
+    try:
+        results = run(registry, args.repeat)
+    finally:
+        cleanup(registry)
+    report(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
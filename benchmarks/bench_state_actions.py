@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Compare the set-based workflow actions with the former per-record loop.
+
+    python3 -m benchmarks.bench_state_actions -c odoo.conf -d estate_bench --size 5000
+
+Run from the module directory with Odoo importable. Each variant works on
+its own freshly created properties and everything is rolled back.
+"""
+
+from .common import build_parser, measure, odoo_env, report
+
+
+def legacy_cancel(properties):
+    """The per-record loop ``action_cancel`` used before it became set-based."""
+    for record in properties:
+        record.state = "canceled"
+        stage_id = record._get_stage_id("stage_lost")
+        if stage_id:
+            record.stage_id = stage_id
+
+
+def legacy_reset(properties):
+    for record in properties:
+        record.state = "new"
+        record.selling_price = 0
+        record.buyer_id = False
+        stage_id = record._get_stage_id("stage_new")
+        if stage_id:
+            record.stage_id = stage_id
+
+
+def create_properties(env, size, label):
+    return env["estate.property"].create(
+        [
+            {"name": f"Benchmark {label} {index}", "expected_price": 100000 + index}
+            for index in range(size)
+        ]
+    )
+
+
+def run(env, size):
+    results = []
+    for label, legacy, action in (
+        ("cancel", legacy_cancel, "action_cancel"),
+        ("reset", legacy_reset, "action_reset"),
+    ):
+        properties = create_properties(env, size, f"legacy {label}")
+        with measure(env, f"state_actions.{label}.loop", results, size=size):
+            legacy(properties)
+        properties = create_properties(env, size, f"bulk {label}")
+        with measure(env, f"state_actions.{label}.set_based", results, size=size):
+            getattr(properties, action)()
+    return results
+
+
+def main():
+    parser = build_parser(__doc__)
+    parser.add_argument("--size", type=int, default=5000, help="Properties per variant")
+    args = parser.parse_args()
+    with odoo_env(args) as env:
+        results = run(env, args.size)
+    report(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
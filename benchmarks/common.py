@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Shared helpers for the hexclad_estate benchmark scripts.
+
+The scripts run outside the Odoo server, against a local database that has
+the module installed, and roll back everything they write.
+"""
+
+import argparse
+import contextlib
+import json
+import time
+import tracemalloc
+
+
+def build_parser(description):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("-c", "--config", help="Odoo configuration file")
+    parser.add_argument("-d", "--database", required=True, help="Database to run against")
+    parser.add_argument("-o", "--output", help="Write the results to this JSON file")
+    return parser
+
+
+def load_registry(args):
+    """Load the Odoo configuration and return the registry of ``args.database``."""
+    from odoo.modules.registry import Registry
+    from odoo.tools import config
+
+    config.parse_config(["-c", args.config] if args.config else [])
+    return Registry(args.database)
+
+
+@contextlib.contextmanager
+def odoo_env(args):
+    """Yield a superuser environment on ``args.database``; always rolls back."""
+    from odoo import SUPERUSER_ID, api
+
+    registry = load_registry(args)
+    with registry.cursor() as cr:
+        env = api.Environment(cr, SUPERUSER_ID, {})
+        try:
+            yield env
+        finally:
+            cr.rollback()
+
+
+@contextlib.contextmanager
+def measure(env, name, results, **extra):
+    """Record wall time, SQL query count and peak Python memory of the block.
+
+    Pending ORM writes are flushed before and after, so the queries a block
+    only schedules are still attributed to it.
+    """
+    env.flush_all()
+    queries = env.cr.sql_log_count
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        yield
+        env.flush_all()
+    finally:
+        wall_time = time.perf_counter() - start
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    results.append(
+        dict(
+            extra,
+            name=name,
+            wall_time=round(wall_time, 6),
+            queries=env.cr.sql_log_count - queries,
+            peak_memory=peak_memory,
+        )
+    )
+
+
+def report(results, output=None):
+    for result in results:
+        print(
+            f"{result['name']:<48} {result['wall_time']:>10.3f}s "
+            f"{result['queries']:>8} queries {result['peak_memory'] / 1024:>10.0f} KiB"
+        )
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Compare two benchmark result files and flag regressions.
+
+    python3 -m benchmarks.compare baseline.json current.json --threshold 20
+
+Results are matched by name. A case regresses when it runs more SQL queries
+than the baseline, or when its wall time grows by more than ``--threshold``
+percent; the exit status is 1 if any case regressed. Needs no Odoo.
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(path):
+    with open(path) as f:
+        return {result["name"]: result for result in json.load(f)}
+
+
+def percent_change(old, new):
+    if not old:
+        return 0.0 if not new else float("inf")
+    return (new - old) / old * 100
+
+
+def compare(baseline, current, threshold):
+    """Print one line per case; return the names of the regressed cases."""
+    regressions = []
+    print(f"{'case':<48} {'wall time':>22} {'queries':>18} {'peak memory':>18}")
+    for name in sorted(baseline.keys() | current.keys()):
+        old, new = baseline.get(name), current.get(name)
+        if old is None or new is None:
+            print(f"{name:<48} {'only in ' + ('current' if old is None else 'baseline'):>22}")
+            continue
+        time_change = percent_change(old["wall_time"], new["wall_time"])
+        memory_change = percent_change(old["peak_memory"], new["peak_memory"])
+        regressed = new["queries"] > old["queries"] or time_change > threshold
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<48} {new['wall_time']:>10.3f}s {time_change:>+9.1f}% "
+            f"{new['queries']:>8} {new['queries'] - old['queries']:>+9} "
+            f"{new['peak_memory'] / 1024:>8.0f}KiB {memory_change:>+7.1f}%"
+            f"{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline", help="Results of the reference run")
+    parser.add_argument("current", help="Results of the run to check")
+    parser.add_argument(
+        "--threshold", type=float, default=20.0, help="Tolerated wall time increase, in percent"
+    )
+    args = parser.parse_args()
+    regressions = compare(load(args.baseline), load(args.current), args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+"""Generate a synthetic portfolio for the benchmarks, with bulk SQL.
+
+    python3 -m benchmarks.datagen -c odoo.conf -d estate_bench --properties 100000
+    python3 -m benchmarks.datagen -c odoo.conf -d estate_bench --purge
+
+Run from the module directory with Odoo importable, against a database with
+the module installed. Unlike the benchmark scripts, the generator commits:
+properties are inserted in chunks with ``generate_series`` (10k to 1M rows
+in minutes), then offers, tags, images and every stored computed column are
+filled set-based, so the data looks like what the ORM would have written.
+Generated records are named ``Synthetic ...`` and ``--purge`` deletes them.
+"""
+
+import io
+import time
+
+from .common import build_parser, odoo_env
+
+PROPERTY_PREFIX = "Synthetic property"
+TAG_PREFIX = "Synthetic tag"
+BUYER_PREFIX = "Synthetic buyer"
+CHUNK_SIZE = 50000
+IMAGE_BATCH_SIZE = 200
+BUYER_COUNT = 200
+# City, latitude, longitude, postcode: properties are scattered around them.
+CITIES = (
+    ("Dallas", 32.7767, -96.7970, "75201"),
+    ("Houston", 29.7604, -95.3698, "77002"),
+    ("Austin", 30.2672, -97.7431, "78701"),
+    ("San Antonio", 29.4241, -98.4936, "78205"),
+    ("Fort Worth", 32.7555, -97.3308, "76102"),
+)
+STATES = ("new", "new", "new", "offer_received", "offer_accepted", "sold", "canceled")
+
+
+def log(message, *args):
+    print(message % args, flush=True)
+
+
+def insert_properties(env, count, published_ratio):
+    """Insert ``count`` properties in committed chunks; return the id range."""
+    cr = env.cr
+    country = env.ref("base.us", raise_if_not_found=False)
+    type_ids = env["estate.property.type"].search([]).ids or [None]
+    cr.execute("SELECT COALESCE(max(id), 0) FROM estate_property")
+    first_id = cr.fetchone()[0] + 1
+    cr.execute("SELECT count(*) FROM estate_property WHERE name LIKE %s", [f"{PROPERTY_PREFIX} %"])
+    offset = cr.fetchone()[0]
+    for start in range(0, count, CHUNK_SIZE):
+        size = min(CHUNK_SIZE, count - start)
+        cr.execute(
+            """
+            INSERT INTO estate_property (
+                name, description, street, city, postcode, country_id, company_id,
+                property_type_id, state, active, is_published, expected_price, selling_price,
+                purchase_price, arv, rehab_cost, closing_costs, holding_costs, monthly_rent,
+                monthly_expenses, bedrooms, bathrooms, living_area, lot_size, garage, garden,
+                garden_area, latitude, longitude, date_created, date_availability,
+                create_uid, create_date, write_uid, write_date
+            )
+            SELECT %(prefix)s || ' ' || g,
+                   'Synthetic listing with ' || (ARRAY['a pool', 'a corner lot', 'a renovated kitchen',
+                       'a large garden', 'a two-car garage', 'hardwood floors'])[1 + g %% 6],
+                   (100 + g %% 9900) || ' Main Street',
+                   (%(cities)s::varchar[])[1 + g %% %(city_count)s],
+                   (%(postcodes)s::varchar[])[1 + g %% %(city_count)s],
+                   %(country_id)s, %(company_id)s,
+                   (%(type_ids)s::int[])[1 + g %% %(type_count)s],
+                   (%(states)s::varchar[])[1 + g %% %(state_count)s],
+                   TRUE, random() < %(published_ratio)s,
+                   round((100000 + random() * 900000)::numeric, -3),
+                   0,
+                   round((80000 + random() * 700000)::numeric, -3),
+                   round((150000 + random() * 900000)::numeric, -3),
+                   round((random() * 80000)::numeric, -2),
+                   round((2000 + random() * 10000)::numeric, -2),
+                   round((random() * 1500)::numeric, -1),
+                   round((900 + random() * 3000)::numeric, -1),
+                   round((300 + random() * 1200)::numeric, -1),
+                   1 + g %% 6, 1 + g %% 4, 600 + g %% 3400, 2000 + g %% 18000,
+                   g %% 2 = 0, g %% 3 = 0, CASE WHEN g %% 3 = 0 THEN 100 ELSE 0 END,
+                   (%(latitudes)s::float[])[1 + g %% %(city_count)s] + (random() - 0.5) * 0.4,
+                   (%(longitudes)s::float[])[1 + g %% %(city_count)s] + (random() - 0.5) * 0.4,
+                   current_date - (g %% 730),
+                   current_date + (g %% 90),
+                   %(uid)s, now() at time zone 'UTC', %(uid)s, now() at time zone 'UTC'
+              FROM generate_series(%(first)s, %(last)s) g
+            """,
+            {
+                "prefix": PROPERTY_PREFIX,
+                "cities": [city[0] for city in CITIES],
+                "postcodes": [city[3] for city in CITIES],
+                "latitudes": [city[1] for city in CITIES],
+                "longitudes": [city[2] for city in CITIES],
+                "city_count": len(CITIES),
+                "country_id": country.id if country else None,
+                "company_id": env.company.id,
+                "type_ids": type_ids,
+                "type_count": len(type_ids),
+                "states": list(STATES),
+                "state_count": len(STATES),
+                "published_ratio": published_ratio,
+                "uid": env.uid,
+                "first": offset + start + 1,
+                "last": offset + start + size,
+            },
+        )
+        cr.commit()
+        log("properties: %s/%s inserted", start + size, count)
+    cr.execute("SELECT COALESCE(max(id), 0) FROM estate_property")
+    return first_id, cr.fetchone()[0]
+
+
+def fill_computed_columns(env, first_id, last_id):
+    """Fill the stored computed columns of the inserted properties, chunked.
+    Stages and search vectors are filled once offers and tags exist."""
+    from odoo.addons.hexclad_estate.tools.geo import geohash_encode
+
+    cr = env.cr
+    Property = env["estate.property"]
+    for start in range(first_id, last_id + 1, CHUNK_SIZE):
+        stop = min(start + CHUNK_SIZE, last_id + 1)
+        cr.execute(
+            """
+            UPDATE estate_property
+               SET website_url = '/properties/' || lower(replace(name, ' ', '-')) || '-' || id
+             WHERE id >= %s AND id < %s
+            """,
+            [start, stop],
+        )
+        cr.execute(
+            "SELECT id, latitude, longitude FROM estate_property WHERE id >= %s AND id < %s",
+            [start, stop],
+        )
+        rows = cr.fetchall()
+        cr.execute(
+            """
+            UPDATE estate_property p SET geohash = v.geohash
+              FROM unnest(%s::int[], %s::varchar[]) AS v(id, geohash)
+             WHERE p.id = v.id
+            """,
+            [[row[0] for row in rows], [geohash_encode(row[1], row[2]) for row in rows]],
+        )
+        Property.browse(range(start, stop))._bulk_recompute_investment_fields()
+        cr.commit()
+        env.invalidate_all()
+        log("computed columns: ids up to %s/%s", stop - 1, last_id)
+
+
+def ensure_buyers(env):
+    Partner = env["res.partner"]
+    buyers = Partner.search([("name", "=like", f"{BUYER_PREFIX} %")])
+    missing = BUYER_COUNT - len(buyers)
+    if missing > 0:
+        buyers |= Partner.create(
+            [{"name": f"{BUYER_PREFIX} {len(buyers) + index + 1}"} for index in range(missing)]
+        )
+    return buyers.ids
+
+
+def insert_offers(env, first_id, last_id, offers_per_property):
+    """Insert up to ``2 * offers_per_property`` increasing offers per
+    property (averaging ``offers_per_property``), then set the offer stats."""
+    cr = env.cr
+    buyer_ids = ensure_buyers(env)
+    max_offers = 2 * offers_per_property
+    for start in range(first_id, last_id + 1, CHUNK_SIZE):
+        stop = min(start + CHUNK_SIZE, last_id + 1)
+        cr.execute(
+            """
+            INSERT INTO estate_property_offer (
+                price, validity, date_deadline, state, partner_id, property_id,
+                property_type_id, create_uid, create_date, write_uid, write_date
+            )
+            SELECT round((p.expected_price * (0.9 + k * 0.02))::numeric, 2),
+                   7 + k, current_date - 30 + (p.id + k) %% 60,
+                   CASE WHEN p.state IN ('offer_accepted', 'sold') AND k = p.id %% (%(max)s + 1)
+                        THEN 'accepted'
+                        WHEN p.state IN ('offer_accepted', 'sold', 'canceled') THEN 'refused'
+                        ELSE 'pending' END,
+                   (%(buyers)s::int[])[1 + (p.id * k) %% %(buyer_count)s],
+                   p.id, p.property_type_id,
+                   %(uid)s, now() at time zone 'UTC', %(uid)s, now() at time zone 'UTC'
+              FROM estate_property p
+              CROSS JOIN LATERAL generate_series(1, p.id %% (%(max)s + 1)) k
+             WHERE p.id >= %(start)s AND p.id < %(stop)s
+            """,
+            {
+                "max": max_offers,
+                "buyers": buyer_ids,
+                "buyer_count": len(buyer_ids),
+                "uid": env.uid,
+                "start": start,
+                "stop": stop,
+            },
+        )
+        cr.execute(
+            """
+            UPDATE estate_property p
+               SET best_price = o.best_price, offer_count = o.offer_count,
+                   last_offer_date = o.last_offer_date,
+                   selling_price = CASE WHEN p.state IN ('offer_accepted', 'sold')
+                                        THEN o.accepted_price ELSE 0 END,
+                   state = CASE WHEN p.state = 'new' THEN 'offer_received' ELSE p.state END
+              FROM (
+                    SELECT property_id, max(price) AS best_price, count(*) AS offer_count,
+                           max(create_date) AS last_offer_date,
+                           COALESCE(max(price) FILTER (WHERE state = 'accepted'), 0) AS accepted_price
+                      FROM estate_property_offer
+                     WHERE property_id >= %s AND property_id < %s
+                     GROUP BY property_id
+                   ) o
+             WHERE p.id = o.property_id
+            """,
+            [start, stop],
+        )
+        cr.commit()
+        log("offers: properties up to %s/%s", stop - 1, last_id)
+    # Stages follow the states, which the offers just updated.
+    from odoo.addons.hexclad_estate.hooks import backfill_property_stages
+
+    backfill_property_stages(env, chunk_size=CHUNK_SIZE, commit=True)
+
+
+def insert_tags(env, first_id, last_id, tag_count):
+    """Create ``tag_count`` tags and give each property up to three of them."""
+    cr = env.cr
+    Tag = env["estate.property.tag"]
+    tags = Tag.search([("name", "=like", f"{TAG_PREFIX} %")])
+    missing = tag_count - len(tags)
+    if missing > 0:
+        tags |= Tag.create(
+            [{"name": f"{TAG_PREFIX} {len(tags) + index + 1}"} for index in range(missing)]
+        )
+    field = env["estate.property"]._fields["tag_ids"]
+    for start in range(first_id, last_id + 1, CHUNK_SIZE):
+        stop = min(start + CHUNK_SIZE, last_id + 1)
+        cr.execute(
+            f"""
+            INSERT INTO {field.relation} ({field.column1}, {field.column2})
+            SELECT p.id, (%(tags)s::int[])[1 + (p.id * 7919 * k) %% %(tag_count)s]
+              FROM estate_property p
+              CROSS JOIN generate_series(1, 3) k
+             WHERE p.id >= %(start)s AND p.id < %(stop)s AND (p.id + k) %% 4 <> 0
+            ON CONFLICT DO NOTHING
+            """,
+            {"tags": tags.ids, "tag_count": len(tags), "start": start, "stop": stop},
+        )
+        cr.commit()
+    fill_search_vectors(env, first_id, last_id)
+    log("tags: %s tags on properties %s-%s", len(tags), first_id, last_id)
+
+
+def fill_search_vectors(env, first_id, last_id):
+    from odoo.tools import SQL
+
+    for start in range(first_id, last_id + 1, CHUNK_SIZE):
+        env.cr.execute(SQL(
+            "UPDATE estate_property p SET search_vector = %s WHERE p.id >= %s AND p.id < %s",
+            env["estate.property"]._search_vector_sql(),
+            start,
+            min(start + CHUNK_SIZE, last_id + 1),
+        ))
+        env.cr.commit()
+
+
+def placeholder_image(index):
+    """A small PNG in one of 16 colors, so the filestore deduplicates them."""
+    from PIL import Image
+
+    color = ((index * 53) % 256, (index * 97) % 256, (index * 193) % 256)
+    buffer = io.BytesIO()
+    Image.new("RGB", (320, 240), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def insert_images(env, first_id, last_id, image_count):
+    """Attach ``image_count`` gallery images (two per property) through the
+    ORM, so that image.mixin stores every resized variant."""
+    import base64
+
+    palette = [base64.b64encode(placeholder_image(index)) for index in range(16)]
+    Image = env["estate.property.image"].with_context(tracking_disable=True)
+    created = 0
+    property_id = first_id
+    while created < image_count and property_id <= last_id:
+        vals_list = []
+        while len(vals_list) < IMAGE_BATCH_SIZE and created + len(vals_list) < image_count:
+            for sequence in (10, 20):
+                vals_list.append(
+                    {
+                        "name": f"Synthetic image {property_id}-{sequence}",
+                        "property_id": property_id,
+                        "sequence": sequence,
+                        "image_1920": palette[(property_id + sequence) % len(palette)],
+                    }
+                )
+            property_id += 1
+            if property_id > last_id:
+                break
+        Image.create(vals_list)
+        created += len(vals_list)
+        env.cr.commit()
+        env.invalidate_all()
+        log("images: %s/%s", created, image_count)
+
+
+def ensure_postcode_centroids(env):
+    Centroid = env["estate.postcode.centroid"]
+    country = env.ref("base.us", raise_if_not_found=False)
+    if not country:
+        return
+    existing = set(Centroid.search([("country_id", "=", country.id)]).mapped("postcode"))
+    Centroid.create(
+        [
+            {
+                "country_id": country.id,
+                "postcode": postcode,
+                "place_name": city,
+                "latitude": latitude,
+                "longitude": longitude,
+            }
+            for city, latitude, longitude, postcode in CITIES
+            if postcode not in existing
+        ]
+    )
+
+
+def purge(env):
+    """Delete every synthetic record created by this script."""
+    cr = env.cr
+    images = env["estate.property.image"].search([("name", "=like", "Synthetic image %")])
+    for start in range(0, len(images), IMAGE_BATCH_SIZE):
+        images[start:start + IMAGE_BATCH_SIZE].unlink()
+        cr.commit()
+    while True:
+        cr.execute(
+            """
+            DELETE FROM estate_property
+             WHERE id IN (SELECT id FROM estate_property WHERE name LIKE %s LIMIT %s)
+            """,
+            [f"{PROPERTY_PREFIX} %", CHUNK_SIZE],
+        )
+        deleted = cr.rowcount
+        cr.commit()
+        if not deleted:
+            break
+        log("purge: %s properties deleted", deleted)
+    env["estate.property.tag"].search([("name", "=like", f"{TAG_PREFIX} %")]).unlink()
+    env["res.partner"].search([("name", "=like", f"{BUYER_PREFIX} %")]).unlink()
+    cr.commit()
+    env["estate.pipeline.rollup"]._refresh(full=True)
+    cr.commit()
+
+
+def main():
+    parser = build_parser(__doc__)
+    parser.add_argument("--properties", type=int, default=10000, help="Properties to generate")
+    parser.add_argument("--offers-per-property", type=int, default=3, help="Average offers per property")
+    parser.add_argument("--tags", type=int, default=40, help="Synthetic tags to spread over properties")
+    parser.add_argument("--images", type=int, default=2000, help="Gallery images (two per property)")
+    parser.add_argument("--published-ratio", type=float, default=0.8, help="Share of published listings")
+    parser.add_argument("--seed", type=float, default=0.42, help="PostgreSQL random() seed, in [-1, 1]")
+    parser.add_argument("--purge", action="store_true", help="Delete the synthetic data instead")
+    args = parser.parse_args()
+    start = time.perf_counter()
+    with odoo_env(args) as env:
+        env = env(context=dict(env.context, tracking_disable=True, mail_create_nolog=True))
+        if args.purge:
+            purge(env)
+        else:
+            env.cr.execute("SELECT setseed(%s)", [args.seed])
+            ensure_postcode_centroids(env)
+            first_id, last_id = insert_properties(env, args.properties, args.published_ratio)
+            fill_computed_columns(env, first_id, last_id)
+            insert_offers(env, first_id, last_id, args.offers_per_property)
+            insert_tags(env, first_id, last_id, args.tags)
+            insert_images(env, first_id, last_id, args.images)
+            env["estate.pipeline.rollup"]._refresh(full=True)
+            env.cr.commit()
+    log("done in %.1fs", time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
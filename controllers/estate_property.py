@@ -1,18 +1,91 @@
 # -*- coding: utf-8 -*-
 
+import hashlib
+import json
 import logging
+import math
+from urllib.parse import urlencode
 
-from markupsafe import Markup
 from werkzeug.exceptions import NotFound
 
-from odoo import http
+from odoo import http, models
 from odoo.http import request
-from odoo.tools import html_escape
 from odoo.tools.misc import formatLang
 
+from ..tools.rate_limit import inquiry_limiter, parse_rate
+from ..tools.render_cache import detail_cache, facet_cache
+
 
 _logger = logging.getLogger(__name__)
 
+PROPERTIES_PER_PAGE = 24
+FULLTEXT_QUERY_MAX_LENGTH = 200
+# Radius of ``near=<lat>,<lon>[,<km>]`` searches, in kilometres.
+NEAR_DEFAULT_RADIUS_KM = 10.0
+NEAR_MAX_RADIUS_KM = 500.0
+SITEMAP_BATCH_SIZE = 1000
+# Everything a listing card renders from estate.property itself.
+LISTING_CARD_FIELDS = [
+    "name", "website_url", "city", "state", "expected_price", "property_type_id",
+]
+# Stored image variants, smallest first (see image.mixin); the original is 1920px.
+IMAGE_VARIANT_SIZES = (128, 256, 512, 1024)
+LISTING_CARD_IMAGE_WIDTH = 512
+GALLERY_HERO_IMAGE_WIDTH = 1024
+GALLERY_THUMB_IMAGE_WIDTH = 256
+# Public listing filters: query parameter -> domain leaves for its value.
+LISTING_FILTER_DOMAINS = {
+    "q": lambda value: [("fulltext", "=", value)],
+    "type_id": lambda value: [("property_type_id", "=", value)],
+    "state": lambda value: [("state", "=", value)],
+    "min_price": lambda value: [("expected_price", ">=", value)],
+    "max_price": lambda value: [("expected_price", "<=", value)],
+    "bedrooms": lambda value: [("bedrooms", ">=", value)],
+    "bathrooms": lambda value: [("bathrooms", ">=", value)],
+    "min_area": lambda value: [("living_area", ">=", value)],
+    "max_area": lambda value: [("living_area", "<=", value)],
+    "city": lambda value: [("city", "=", value)],
+    "tag_ids": lambda value: [("tag_ids", "in", value)],
+    "utility_ids": lambda value: [("utility_ids", "in", value)],
+    "bbox": lambda value: request.env["estate.property"]._bbox_domain(*value),
+    "near": lambda value: request.env["estate.property"]._radius_domain(*value),
+}
+# Facet name -> (grouped field, filters ignored when counting it). Ignoring a
+# facet's own filter keeps its other values selectable (disjunctive facets).
+LISTING_VALUE_FACETS = {
+    "property_type": ("property_type_id", ("type_id",)),
+    "state": ("state", ("state",)),
+    "city": ("city", ("city",)),
+    "bedrooms": ("bedrooms", ("bedrooms",)),
+    "bathrooms": ("bathrooms", ("bathrooms",)),
+    "tags": ("tag_ids", ("tag_ids",)),
+    "utilities": ("utility_ids", ("utility_ids",)),
+}
+LISTING_RANGE_FACETS = {
+    "price": ("expected_price", ("min_price", "max_price")),
+    "living_area": ("living_area", ("min_area", "max_area")),
+}
+FACET_VALUE_LIMIT = 50
+# Fields the JSON listing API may project: public listing data only, never the
+# investment analysis or internal assignment fields.
+API_FIELDS = (
+    "name", "website_url", "description", "street", "street2", "city", "postcode",
+    "state_id", "country_id", "expected_price", "best_price", "state", "bedrooms",
+    "bathrooms", "living_area", "lot_size", "garage", "garden", "garden_area",
+    "property_type_id", "tag_ids", "utility_ids", "date_availability", "latitude",
+    "longitude", "write_date",
+)
+API_DEFAULT_FIELDS = ("name", "website_url", "city", "expected_price", "state")
+API_MAX_LIMIT = 100
+# Inquiry rate limits as "<burst>/<seconds>", overridable through system
+# parameters; "0" disables a limit.
+INQUIRY_RATE_LIMITS = {
+    "ip": ("hexclad_estate.inquiry_rate_limit_ip", "5/600"),
+    "property": ("hexclad_estate.inquiry_rate_limit_property", "30/600"),
+}
+# Stands in for the per-session CSRF token inside cached detail page bodies.
+CSRF_TOKEN_PLACEHOLDER = "__estate_csrf_token__"
+
 
 class EstatePropertyWebsite(http.Controller):
     def _get_property_model(self):
@@ -32,43 +105,453 @@ class EstatePropertyWebsite(http.Controller):
             raise NotFound()
 
     @staticmethod
-    def _sitemap_properties(env, rule, qs):
-        Property = env["estate.property"].sudo()
-        properties = Property.search(
-            [("website_published", "=", True), ("active", "=", True)]
+    def _image_url(record, width=None):
+        """Return the URL of the smallest stored image variant of ``record``
+        that is at least ``width`` pixels wide, or of the original image."""
+        size = next((size for size in IMAGE_VARIANT_SIZES if width and size >= width), None)
+        if size:
+            field_name = f"image_{size}"
+        else:
+            field_name = "image" if record._name == "estate.property" else "image_1920"
+        return f"/web/image/{record._name}/{record.id}/{field_name}"
+
+    @staticmethod
+    def _parse_cursor(value):
+        try:
+            cursor = int(value)
+        except (TypeError, ValueError):
+            return False
+        return cursor if cursor > 0 else False
+
+    @staticmethod
+    def _search_page(
+        Property, domain, after=False, before=False, limit=PROPERTIES_PER_PAGE, field_names=()
+    ):
+        """Keyset-paginate ``domain`` on ``id desc`` (the model ``_order``).
+
+        ``after`` returns the page following the record with that id, ``before``
+        the page preceding it. Each page is a single bounded index scan, so its
+        cost does not depend on how many listings precede it. ``field_names``
+        are fetched by that same query.
+        """
+        if before:
+            records = Property.search_fetch(
+                domain + [("id", ">", before)], field_names, order="id asc", limit=limit + 1
+            )
+            has_prev = len(records) > limit
+            return records[:limit].sorted("id", reverse=True), has_prev, True
+        if after:
+            domain = domain + [("id", "<", after)]
+        records = Property.search_fetch(domain, field_names, order="id desc", limit=limit + 1)
+        has_next = len(records) > limit
+        return records[:limit], bool(after), has_next
+
+    def _search_ranked_page(self, Property, filters, page):
+        """Return one page of a keyword search, best match first, with the
+        previous and next page URLs.
+
+        Relevance order has no stable key to seek on, so keyword results page
+        by offset; the match itself is a GIN index scan.
+        """
+        page = self._parse_cursor(page) or 1
+        properties = Property._search_fulltext_ranked(
+            filters["q"],
+            self._listing_domain(filters, exclude=("q",)),
+            limit=PROPERTIES_PER_PAGE + 1,
+            offset=(page - 1) * PROPERTIES_PER_PAGE,
+        )
+        has_next = len(properties) > PROPERTIES_PER_PAGE
+        properties = properties[:PROPERTIES_PER_PAGE]
+        properties.fetch(LISTING_CARD_FIELDS)
+        prev_url = self._page_url(filters, page=page - 1 if page > 2 else None) if page > 1 else False
+        next_url = self._page_url(filters, page=page + 1) if has_next else False
+        return properties, prev_url, next_url
+
+    def _prepare_listing_cards(self, properties):
+        """Return the values rendered by each listing card.
+
+        Runs a fixed number of queries whatever the page size: the card fields
+        come with the page search, then one query each for type names, gallery
+        images and main image attachments. Nothing is lazily loaded per card.
+        """
+        if not properties:
+            return []
+        property_ids = properties.ids
+        # Property types are read privileged: see the filter dropdown below.
+        property_types = properties.sudo().property_type_id
+        property_types.fetch(["name"])
+        type_names = {ptype.id: ptype.name for ptype in property_types}
+        first_image_ids = {}
+        images = request.env["estate.property.image"].sudo().search_fetch(
+            [("property_id", "in", property_ids)], ["property_id"], order="sequence, id"
         )
+        for image in images:
+            first_image_ids.setdefault(image.property_id.id, image.id)
+        main_image_ids = set(
+            request.env["ir.attachment"].sudo().search_fetch(
+                [
+                    ("res_model", "=", "estate.property"),
+                    ("res_field", "=", "image"),
+                    ("res_id", "in", property_ids),
+                ],
+                ["res_id"],
+            ).mapped("res_id")
+        )
+        state_labels = dict(properties._fields["state"].selection)
+        Image = request.env["estate.property.image"]
+        cards = []
         for property_record in properties:
-            if property_record.website_url:
-                yield {"loc": property_record.website_url}
+            image_url = False
+            if property_record.id in first_image_ids:
+                image_url = self._image_url(
+                    Image.browse(first_image_ids[property_record.id]),
+                    LISTING_CARD_IMAGE_WIDTH,
+                )
+            elif property_record.id in main_image_ids:
+                image_url = self._image_url(property_record, LISTING_CARD_IMAGE_WIDTH)
+            cards.append(
+                {
+                    "id": property_record.id,
+                    "name": property_record.name,
+                    "url": property_record.website_url,
+                    "type_name": type_names.get(property_record.property_type_id.id, ""),
+                    "city": property_record.city or "",
+                    "expected_price": property_record.expected_price,
+                    "state_label": state_labels.get(property_record.state),
+                    "image_url": image_url,
+                }
+            )
+        return cards
 
-    @http.route(["/properties"], type="http", auth="public", website=True, sitemap=True)
-    def properties(self, type_id=None, state=None, **kwargs):
-        Property = self._get_property_model()
-        domain = [("website_published", "=", True), ("active", "=", True)]
-        selected_type_id = False
-        if type_id:
+    @staticmethod
+    def _page_url(filters, **cursor):
+        params = {
+            key: ",".join(map(str, value)) if isinstance(value, list) else value
+            for key, value in {**filters, **cursor}.items()
+            if value
+        }
+        return f"/properties?{urlencode(params)}" if params else "/properties"
+
+    @staticmethod
+    def _parse_listing_filters(params):
+        """Return the valid, non-empty listing filters found in ``params``."""
+
+        def number(key, cast):
             try:
-                selected_type_id = int(type_id)
-                domain.append(("property_type_id", "=", selected_type_id))
+                return cast(params[key]) if params.get(key) not in (None, "") else None
             except (TypeError, ValueError):
-                selected_type_id = False
-        if state:
-            domain.append(("state", "=", state))
-        properties = Property.search(domain)
-        # Property type metadata powers public filters on this page. Keep this
-        # read privileged because estate.property.type intentionally has no
-        # ACL for public/portal users.
-        property_types = request.env["estate.property.type"].sudo().search([])
+                return None
+
+        def ids(key):
+            value = params.get(key) or ""
+            try:
+                return sorted({int(part) for part in value.split(",") if part.strip()})
+            except ValueError:
+                return []
+
+        def coordinates(key):
+            try:
+                values = [float(part) for part in (params.get(key) or "").split(",")]
+            except ValueError:
+                return []
+            return values if all(map(math.isfinite, values)) else []
+
+        def valid_point(latitude, longitude):
+            return -90 <= latitude <= 90 and -180 <= longitude <= 180
+
+        # bbox=<south>,<west>,<north>,<east>, as sent by map viewports.
+        bbox = coordinates("bbox")
+        if len(bbox) != 4 or not (
+            valid_point(bbox[0], bbox[1]) and valid_point(bbox[2], bbox[3]) and bbox[0] <= bbox[2]
+        ):
+            bbox = None
+        near = coordinates("near")
+        if len(near) == 2:
+            near.append(NEAR_DEFAULT_RADIUS_KM)
+        if len(near) != 3 or not valid_point(near[0], near[1]) or near[2] <= 0:
+            near = None
+        else:
+            near[2] = min(near[2], NEAR_MAX_RADIUS_KM)
+
+        state = params.get("state")
+        states = dict(request.env["estate.property"]._fields["state"].selection)
+        filters = {
+            "q": (params.get("q") or "").strip()[:FULLTEXT_QUERY_MAX_LENGTH] or None,
+            "type_id": number("type_id", int),
+            "state": state if state in states else None,
+            "min_price": number("min_price", float),
+            "max_price": number("max_price", float),
+            "bedrooms": number("bedrooms", int),
+            "bathrooms": number("bathrooms", float),
+            "min_area": number("min_area", int),
+            "max_area": number("max_area", int),
+            "city": (params.get("city") or "").strip() or None,
+            "tag_ids": ids("tag_ids"),
+            "utility_ids": ids("utility_ids"),
+            "bbox": bbox,
+            "near": near,
+        }
+        return {key: value for key, value in filters.items() if value}
+
+    @staticmethod
+    def _listing_domain(filters, exclude=()):
+        domain = [("website_published", "=", True), ("active", "=", True)]
+        for key, value in filters.items():
+            if key not in exclude:
+                domain += LISTING_FILTER_DOMAINS[key](value)
+        return domain
+
+    @staticmethod
+    def _get_cached_facets(kind, filters, compute):
+        """Return ``compute()`` for these filters, memoized per worker process
+        with a short TTL so that listing page views do not aggregate the
+        catalogue on every hit (see ``facet_cache``)."""
+        key = (
+            request.env.cr.dbname,
+            "facets",
+            kind,
+            request.website.id,
+            request.env.lang,
+            json.dumps(filters, sort_keys=True),
+        )
+        values = facet_cache.get(key)
+        if values is None:
+            values = compute()
+            facet_cache.set(key, values)
+        return values
+
+    def _compute_type_options(self, Property, filters):
+        """Return the property type filter options with their listing counts,
+        by name (names read privileged, see ``_compute_facets``)."""
+        type_groups = Property._read_group(
+            self._listing_domain(filters, exclude=("type_id",)),
+            ["property_type_id"],
+            ["__count"],
+        )
+        return sorted(
+            (
+                {"id": ptype.id, "name": ptype.sudo().name, "count": count}
+                for ptype, count in type_groups
+                if ptype
+            ),
+            key=lambda ptype: ptype["name"],
+        )
+
+    def _compute_facets(self, Property, filters):
+        """Return the per-value counts and value ranges of every facet.
+
+        Each facet is one grouped SQL aggregate over the published listings
+        matching the other filters; nothing is counted in Python.
+        """
+        state_labels = dict(Property._fields["state"].selection)
+        facets = {}
+        for name, (field_name, own_filters) in LISTING_VALUE_FACETS.items():
+            groups = Property._read_group(
+                self._listing_domain(filters, exclude=own_filters),
+                [field_name],
+                ["__count"],
+                order="__count DESC",
+                limit=FACET_VALUE_LIMIT,
+            )
+            values = []
+            for value, count in groups:
+                if isinstance(value, models.BaseModel):
+                    if not value:
+                        continue
+                    # Names are read privileged, as property types have no
+                    # public ACL; only ids present in published listings show.
+                    value, label = value.id, value.sudo().display_name
+                elif value is None or value is False:
+                    continue
+                else:
+                    label = state_labels.get(value, value) if field_name == "state" else value
+                values.append({"value": value, "label": label, "count": count})
+            facets[name] = values
+        for name, (field_name, own_filters) in LISTING_RANGE_FACETS.items():
+            [(minimum, maximum)] = Property._read_group(
+                self._listing_domain(filters, exclude=own_filters),
+                [],
+                [f"{field_name}:min", f"{field_name}:max"],
+            )
+            facets[name] = {"min": minimum, "max": maximum}
+        return facets
+
+    @staticmethod
+    def _sitemap_properties(env, rule, qs):
+        """Yield the sitemap entries of published properties, in id batches.
+
+        Each batch fetches only the stored ``website_url`` and ``write_date``
+        and is evicted from the cache before the next one, so memory stays
+        flat however many listings are published.
+        """
+        Property = env["estate.property"].sudo()
+        domain = [("website_published", "=", True), ("active", "=", True)]
+        last_id = 0
+        while True:
+            batch = Property.search_fetch(
+                domain + [("id", ">", last_id)],
+                ["website_url", "write_date"],
+                order="id",
+                limit=SITEMAP_BATCH_SIZE,
+            )
+            if not batch:
+                return
+            for property_record in batch:
+                loc = property_record.website_url
+                if loc and (not qs or qs.lower() in loc):
+                    yield {"loc": loc, "lastmod": property_record.write_date.date()}
+            last_id = batch[-1].id
+            batch.invalidate_recordset()
+
+    @http.route(["/properties"], type="http", auth="public", website=True, sitemap=True)
+    def properties(self, after=None, before=None, page=None, **kwargs):
+        Property = self._get_property_model()
+        filters = self._parse_listing_filters(kwargs)
+        if filters.get("q"):
+            properties, prev_url, next_url = self._search_ranked_page(Property, filters, page)
+        else:
+            domain = self._listing_domain(filters)
+            after = self._parse_cursor(after)
+            before = self._parse_cursor(before) if not after else False
+            properties, has_prev, has_next = self._search_page(
+                Property,
+                domain,
+                after=after,
+                before=before,
+                limit=PROPERTIES_PER_PAGE,
+                field_names=LISTING_CARD_FIELDS,
+            )
+            prev_url = (
+                self._page_url(filters, before=properties[0].id)
+                if has_prev and properties
+                else False
+            )
+            next_url = (
+                self._page_url(filters, after=properties[-1].id)
+                if has_next and properties
+                else False
+            )
+        property_types = self._get_cached_facets(
+            "property_types", filters, lambda: self._compute_type_options(Property, filters)
+        )
         state_selection = request.env["estate.property"]._fields["state"].selection
         values = {
             "properties": properties,
+            "cards": self._prepare_listing_cards(properties),
             "property_types": property_types,
             "state_selection": state_selection,
-            "selected_type_id": selected_type_id,
-            "selected_state": state or False,
+            "filters": filters,
+            "selected_type_id": filters.get("type_id", False),
+            "selected_state": filters.get("state", False),
+            "prev_url": prev_url,
+            "next_url": next_url,
         }
         return request.render("hexclad_estate.estate_property_listing", values)
 
+    @http.route(
+        ["/properties/facets"],
+        type="http",
+        auth="public",
+        website=True,
+        methods=["GET"],
+        sitemap=False,
+    )
+    def property_facets(self, **kwargs):
+        """Faceted search over the public listing, as JSON.
+
+        Accepts the same filters as ``/properties`` and returns the matching
+        listing count plus, for each facet, the count of every value. Counts
+        are memoized per filter signature for up to a minute.
+        """
+        Property = self._get_property_model()
+        filters = self._parse_listing_filters(kwargs)
+        counts = self._get_cached_facets(
+            "facets",
+            filters,
+            lambda: {
+                "count": Property.search_count(self._listing_domain(filters)),
+                "facets": self._compute_facets(Property, filters),
+            },
+        )
+        return request.make_json_response({"filters": filters, **counts})
+
+    @http.route(
+        ["/properties/json"],
+        type="http",
+        auth="public",
+        website=True,
+        methods=["GET"],
+        sitemap=False,
+    )
+    def properties_json(self, fields=None, after=None, limit=None, **kwargs):
+        """JSON listing of published properties for apps and partner portals.
+
+        ``fields`` is a comma-separated projection among ``API_FIELDS``,
+        ``after`` the keyset cursor returned as ``next_cursor`` and ``limit``
+        the page size (at most ``API_MAX_LIMIT``); the ``/properties`` filters
+        apply. Reads go through the website user, like the HTML listing.
+        Responses carry a strong ETag hashed from the serialized body, so any
+        change of the page content (a listing entering or leaving the page,
+        a renamed type or tag) changes it; ``If-None-Match`` requests for an
+        unchanged body get an empty 304.
+        """
+        Property = self._get_property_model()
+        requested = fields.split(",") if fields else API_DEFAULT_FIELDS
+        projection = list(dict.fromkeys(
+            name.strip() for name in requested if name.strip() in API_FIELDS
+        ))
+        filters = self._parse_listing_filters(kwargs)
+        limit = min(self._parse_cursor(limit) or PROPERTIES_PER_PAGE, API_MAX_LIMIT)
+        after = self._parse_cursor(after)
+        properties, _has_prev, has_next = self._search_page(
+            Property,
+            self._listing_domain(filters),
+            after=after,
+            limit=limit,
+            field_names=projection,
+        )
+        body = json.dumps(
+            {
+                "fields": projection,
+                "items": [self._serialize_api_record(p, projection) for p in properties],
+                "next_cursor": properties[-1].id if has_next else None,
+            },
+            ensure_ascii=False,
+            default=str,
+        )
+        etag = hashlib.sha256(body.encode()).hexdigest()
+        if request.httprequest.if_none_match.contains_weak(etag):
+            response = request.make_response("", status=304)
+        else:
+            response = request.make_response(
+                body, headers=[("Content-Type", "application/json; charset=utf-8")]
+            )
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+    @staticmethod
+    def _serialize_api_record(record, projection):
+        values = {"id": record.id}
+        for field_name in projection:
+            field = record._fields[field_name]
+            # Related names are read privileged (property types have no public
+            # ACL), batched over the whole page through prefetching.
+            if field.type == "many2one":
+                related = record.sudo()[field_name]
+                value = {"id": related.id, "name": related.display_name} if related else None
+            elif field.type == "many2many":
+                value = [
+                    {"id": related.id, "name": related.display_name}
+                    for related in record.sudo()[field_name]
+                ]
+            elif field.type in ("date", "datetime"):
+                value = record[field_name].isoformat() if record[field_name] else None
+            else:
+                value = record[field_name]
+            values[field_name] = value
+        return values
+
     @http.route(
         ["/properties/<string:property_slug>"],
         type="http",
@@ -77,30 +560,58 @@ class EstatePropertyWebsite(http.Controller):
         sitemap=_sitemap_properties,
     )
     def property_detail(self, property_slug, **kwargs):
-        property_id = self._extract_property_id(property_slug)
-        property = request.env["estate.property"].sudo().browse(property_id).exists()
+        Property = request.env["estate.property"].sudo()
+        property = Property.search(
+            [("website_url", "=", f"/properties/{property_slug}")], limit=1
+        )
+        if not property:
+            # Stale slug (the property was renamed) or a bare id: resolve by id
+            # and send visitors and crawlers to the canonical URL.
+            property_id = self._extract_property_id(property_slug)
+            property = Property.browse(property_id).exists()
+            if property and property.website_published and property.active:
+                return request.redirect(property.website_url, code=301)
         if not property or not property.website_published or not property.active:
             raise NotFound()
-        gallery_images = []
-        index = 0
-        if property.image:
-            gallery_images.append(
-                {
-                    "url": f"/web/image/estate.property/{property.id}/image",
-                    "alt": property.name,
-                    "index": index,
-                }
+        # Editors get branded, editable markup: never serve or store it.
+        use_cache = not request.env.user.has_group(
+            "website.group_website_restricted_editor"
+        )
+        cache_key = (
+            request.env.cr.dbname,
+            property.id,
+            property.write_date,
+            request.env.lang,
+            request.website.id,
+        )
+        detail_html = detail_cache.get(cache_key) if use_cache else None
+        if detail_html is None:
+            detail_html = request.env["ir.qweb"]._render(
+                "hexclad_estate.estate_property_detail_content",
+                self._prepare_detail_values(property),
             )
-            index += 1
-        for image in property.image_ids.sudo():
+            if use_cache:
+                detail_cache.set(cache_key, detail_html)
+        detail_html = detail_html.replace(CSRF_TOKEN_PLACEHOLDER, request.csrf_token())
+        return request.render(
+            "hexclad_estate.estate_property_detail",
+            {"property": property, "detail_html": detail_html},
+        )
+
+    def _prepare_detail_values(self, property):
+        gallery_images = []
+        sources = [(property, property.name)] if property.image else []
+        sources += [(image, image.name or property.name) for image in property.image_ids.sudo()]
+        for index, (record, alt) in enumerate(sources):
             gallery_images.append(
                 {
-                    "url": f"/web/image/estate.property.image/{image.id}/image_1920",
-                    "alt": image.name or property.name,
+                    "url": self._image_url(record),
+                    "hero_url": self._image_url(record, GALLERY_HERO_IMAGE_WIDTH),
+                    "thumb_url": self._image_url(record, GALLERY_THUMB_IMAGE_WIDTH),
+                    "alt": alt,
                     "index": index,
                 }
             )
-            index += 1
         currency = (
             property.company_id.currency_id
             if property.company_id
@@ -115,18 +626,44 @@ class EstatePropertyWebsite(http.Controller):
             else ""
         )
         state_selection = dict(property._fields["state"].selection)
-        return request.render(
-            "hexclad_estate.estate_property_detail",
-            {
-                "property": property,
-                "currency": currency,
-                "gallery_images": gallery_images,
-                "gallery_count": len(gallery_images),
-                "formatted_expected_price": formatted_expected_price,
-                "formatted_best_price": formatted_best_price,
-                "state_selection": state_selection,
-            },
-        )
+        return {
+            "property": property,
+            "currency": currency,
+            "gallery_images": gallery_images,
+            "gallery_count": len(gallery_images),
+            "formatted_expected_price": formatted_expected_price,
+            "formatted_best_price": formatted_best_price,
+            "state_selection": state_selection,
+            "csrf_token_placeholder": CSRF_TOKEN_PLACEHOLDER,
+        }
+
+    def _check_inquiry_rate_limit(self, property_id):
+        """Spend a token for the client IP, then for the property.
+
+        Runs before any ORM write: the system parameters are served from the
+        registry cache, so a rejected request costs no query at all. Returns
+        the seconds to wait when rejected, else 0.
+        """
+        ICP = request.env["ir.config_parameter"].sudo()
+        dbname = request.env.cr.dbname
+        keys = {
+            "ip": ("ip", dbname, request.httprequest.remote_addr),
+            "property": ("property", dbname, property_id),
+        }
+        for scope, (param, default) in INQUIRY_RATE_LIMITS.items():
+            rate = parse_rate(ICP.get_param(param, default), parse_rate(default, None))
+            if not rate:
+                continue
+            retry_after = inquiry_limiter.consume(keys[scope], *rate)
+            if retry_after:
+                _logger.debug(
+                    "Rejected inquiry on property %s from %s (%s limit)",
+                    property_id,
+                    request.httprequest.remote_addr,
+                    scope,
+                )
+                return retry_after
+        return 0
 
     @http.route(
         ["/properties/<string:property_slug>/inquiry"],
@@ -138,150 +675,32 @@ class EstatePropertyWebsite(http.Controller):
     )
     def property_inquiry(self, property_slug, **post):
         property_id = self._extract_property_id(property_slug)
+        retry_after = self._check_inquiry_rate_limit(property_id)
+        if retry_after:
+            return request.make_response(
+                "Too many inquiries, please try again later.",
+                headers=[
+                    ("Content-Type", "text/plain; charset=utf-8"),
+                    ("Retry-After", str(math.ceil(retry_after))),
+                ],
+                status=429,
+            )
         property = request.env["estate.property"].sudo().browse(property_id).exists()
         if not property or not property.website_published or not property.active:
             raise NotFound()
-        name = (post.get("name") or "").strip() or "Website Visitor"
-        email = (post.get("email") or "").strip()
-        phone = (post.get("phone") or "").strip()
-        message = (post.get("message") or "").strip()
-        base_url = request.env["ir.config_parameter"].sudo().get_param("web.base.url")
-        property_url = (
-            f"{base_url}{property.website_url}"
-            if base_url and property.website_url
-            else ""
-        )
-        Partner = request.env["res.partner"].sudo()
-        partner = False
-        if email:
-            partner = Partner.search([("email", "=ilike", email)], limit=1)
-        if not partner:
-            partner = Partner.create(
-                {
-                    "name": name,
-                    "email": email or False,
-                    "phone": phone or False,
-                }
-            )
-        elif phone and not partner.phone:
-            partner.phone = phone
-
-        def _display(value):
-            return html_escape(value) if value else "—"
-
-        property_address = ", ".join(
-            filter(
-                None,
-                [
-                    property.street,
-                    property.street2,
-                    property.city,
-                    property.state_id.name if property.state_id else False,
-                    property.postcode,
-                    property.country_id.name if property.country_id else False,
-                ],
-            )
-        )
-        property_url_html = (
-            f'<a href="{html_escape(property_url)}">{html_escape(property_url)}</a>'
-            if property_url
-            else "—"
-        )
-        message_html = html_escape(message or "—").replace("\n", "<br/>")
-        body = Markup(
-            f"""
-            <p><strong>Website Inquiry</strong></p>
-            <ul>
-              <li><strong>Name:</strong> {_display(name)}</li>
-              <li><strong>Email:</strong> {_display(email)}</li>
-              <li><strong>Phone:</strong> {_display(phone)}</li>
-              <li><strong>Property:</strong> {_display(property.name)}</li>
-              <li><strong>Address:</strong> {_display(property_address)}</li>
-              <li><strong>Property URL:</strong> {property_url_html}</li>
-            </ul>
-            <p><strong>Message:</strong></p>
-            <p>{message_html}</p>
-        """
-        )
-
-        salesperson_partner = (
-            property.user_id.partner_id if property.user_id else False
-        )
-        partner_ids = [salesperson_partner.id] if salesperson_partner else []
-
-        property.sudo().message_post(
-            body=body,
-            message_type="comment",
-            subtype_xmlid="mail.mt_comment",
-            author_id=partner.id,
-            email_from=email or False,
-            partner_ids=partner_ids,
-        )
-
-        lead = False
-        if "crm.lead" in request.env.registry.models:
-            Lead = request.env["crm.lead"].sudo()
-            stage = request.env["crm.stage"].sudo().search(
-                [("name", "=", "New Prospect")], limit=1
-            )
-            if not stage:
-                stage = request.env["crm.stage"].sudo().search(
-                    [], order="sequence,id", limit=1
-                )
-            description_lines = [
-                "Website Inquiry",
-                f"Name: {name or '—'}",
-                f"Email: {email or '—'}",
-                f"Phone: {phone or '—'}",
-                f"Property: {property.name or '—'}",
-                f"Address: {property_address or '—'}",
-                f"Property URL: {property_url or '—'}",
-                "Message:",
-                message or "—",
-            ]
-            lead_vals = {
-                "name": f"Website Inquiry: {property.name}",
-                "partner_id": partner.id,
-                "email_from": email or False,
-                "phone": phone or False,
-                "user_id": property.user_id.id if property.user_id else False,
-                "description": "\n".join(description_lines),
+        # Only persist the submission here; partner matching, chatter posts,
+        # CRM lead and salesperson email are handled by the inquiry cron.
+        Inquiry = request.env["estate.property.inquiry"].sudo()
+        Inquiry.create(
+            {
+                "property_id": property.id,
+                "name": (post.get("name") or "").strip() or "Website Visitor",
+                "email": (post.get("email") or "").strip() or False,
+                "phone": (post.get("phone") or "").strip() or False,
+                "message": (post.get("message") or "").strip() or False,
             }
-            if "type" in Lead._fields:
-                lead_vals["type"] = "opportunity"
-            if stage:
-                lead_vals["stage_id"] = stage.id
-            lead = Lead.create(lead_vals)
-            lead.message_post(
-                body=body,
-                message_type="comment",
-                subtype_xmlid="mail.mt_comment",
-                author_id=partner.id,
-                email_from=email or False,
-                partner_ids=partner_ids,
-            )
-
-        salesperson_email = salesperson_partner.email if salesperson_partner else False
-        sender_email = (
-            property.company_id.email or request.env.company.email or email or False
         )
-        if salesperson_email:
-            mail_vals = {
-                "subject": f"New website inquiry: {property.name}",
-                "body_html": body,
-                "email_to": salesperson_email,
-                "email_from": (
-                    f"Notifications <{sender_email}>" if sender_email else False
-                ),
-                "auto_delete": True,
-            }
-            try:
-                request.env["mail.mail"].sudo().create(mail_vals).send()
-            except Exception:
-                _logger.exception(
-                    "Failed to send inquiry email to salesperson for property %s",
-                    property.id,
-                )
+        Inquiry._trigger_processing()
         return request.render(
             "hexclad_estate.estate_property_inquiry_thanks",
             {"property": property},
@@ -1,5 +1,13 @@
 # -*- coding: utf-8 -*-
 
+import logging
+
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+BACKFILL_CHUNK_SIZE = 50000
+
 STAGE_UPDATES = {
     "stage_new": {"name": "New", "sequence": 10, "is_won": False, "is_lost": False, "fold": False},
     "stage_offer": {"name": "Offer Received", "sequence": 20, "is_won": False, "is_lost": False, "fold": False},
@@ -21,8 +29,78 @@ def post_init_hook(env):
         if stage:
             stage.write(values)
 
-    properties = env["estate.property"].search([])
-    for property_record in properties:
-        stage_id = property_record._get_stage_id_for_state(property_record.state)
-        if stage_id and property_record.stage_id.id != stage_id:
-            property_record.stage_id = stage_id
+    backfill_property_stages(env)
+    backfill_search_vectors(env)
+
+
+def backfill_property_stages(env, state_stage_ids=None, chunk_size=BACKFILL_CHUNK_SIZE, commit=False):
+    """Move every property to the stage of its workflow state, in SQL.
+
+    ``state_stage_ids`` maps states to stage ids and defaults to the workflow
+    stages; pass another mapping to remap stages from a migration script.
+    Runs one ``UPDATE ... FROM (VALUES ...)`` per id range of ``chunk_size``
+    and logs progress after each. Only misaligned rows are written, so an
+    interrupted run resumes where it stopped; ``commit`` commits every chunk
+    (for shell runs on large databases, not inside install or upgrade).
+    Returns the number of properties moved.
+    """
+    if state_stage_ids is None:
+        state_stage_ids = env["estate.property.stage"]._get_state_stage_map()
+    if not state_stage_ids:
+        return 0
+    cr = env.cr
+    env["estate.property"].flush_model(["state", "stage_id"])
+    cr.execute("SELECT min(id), max(id) FROM estate_property")
+    min_id, max_id = cr.fetchone()
+    if min_id is None:
+        return 0
+    mapping = SQL(", ").join(
+        SQL("(%s, %s)", state, stage_id) for state, stage_id in state_stage_ids.items()
+    )
+    updated = 0
+    for start in range(min_id, max_id + 1, chunk_size):
+        # write_date is bumped for the caches and rollups keyed on it.
+        cr.execute(SQL(
+            """
+            UPDATE estate_property p
+               SET stage_id = m.stage_id, write_date = %s
+              FROM (VALUES %s) AS m(state, stage_id)
+             WHERE p.state = m.state
+               AND p.id >= %s AND p.id < %s
+               AND p.stage_id IS DISTINCT FROM m.stage_id
+            """,
+            cr.now(),
+            mapping,
+            start,
+            start + chunk_size,
+        ))
+        updated += cr.rowcount
+        _logger.info(
+            "Property stage backfill: ids %s-%s of %s done, %s properties moved",
+            start,
+            min(start + chunk_size - 1, max_id),
+            max_id,
+            updated,
+        )
+        if commit:
+            cr.commit()
+    env["estate.property"].invalidate_model(["stage_id", "write_date"])
+    return updated
+
+
+def backfill_search_vectors(env):
+    """Fill the full-text search vector of the properties that have none.
+
+    Runs after install and upgrade rather than from ``estate.property.init``,
+    because the vector reads the tag tables, which do not exist yet when the
+    property table is initialized. Returns the number of properties filled.
+    """
+    Property = env["estate.property"]
+    Property.flush_model()
+    env["estate.property.tag"].flush_model(["name"])
+    env.cr.execute(SQL(
+        "UPDATE estate_property p SET search_vector = %s WHERE p.search_vector IS NULL",
+        Property._search_vector_sql(),
+    ))
+    _logger.info("Full-text search vectors filled: %s properties", env.cr.rowcount)
+    return env.cr.rowcount
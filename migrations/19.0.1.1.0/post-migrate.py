@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+
+from odoo import SUPERUSER_ID, api
+
+from odoo.addons.hexclad_estate.hooks import backfill_property_stages, backfill_search_vectors
+
+
+def migrate(cr, version):
+    if not version:
+        return
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    backfill_property_stages(env)
+    backfill_search_vectors(env)
@@ -7,4 +7,10 @@ from . import estate_property_tag
 from . import estate_property_utility
 from . import estate_property_offer
 from . import estate_property_image
+from . import estate_property_inquiry
+from . import estate_postcode_centroid
+from . import estate_geocoder
+from . import estate_portfolio_analytics
+from . import estate_pipeline_rollup
 from . import res_users
+from . import res_partner
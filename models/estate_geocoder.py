@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+from odoo import api, models
+
+from ..tools.geo import normalize_postcode
+
+
+class EstateGeocoder(models.AbstractModel):
+    """
+    Geocoder used to place properties on the map.
+
+    The default implementation is offline: it resolves the property postcode
+    against ``estate.postcode.centroid``. Other providers plug in by inheriting
+    this model and overriding ``_geocode_properties``.
+    """
+
+    _name = "estate.geocoder"
+    _description = "Real Estate Geocoder"
+
+    @api.model
+    def _geocode_properties(self, properties):
+        """Return ``{property id: (latitude, longitude)}`` for the properties
+        that could be located; the others are left out."""
+        keys = {}
+        for property_record in properties:
+            postcode = normalize_postcode(property_record.postcode)
+            if postcode:
+                # ZIP+4 style postcodes fall back to their leading part.
+                candidates = [postcode]
+                if "-" in postcode:
+                    candidates.append(postcode.split("-", 1)[0])
+                keys[property_record.id] = (property_record.country_id.id, candidates)
+        if not keys:
+            return {}
+        centroids = self.env["estate.postcode.centroid"].sudo().search_fetch(
+            [("postcode", "in", list({code for _c, codes in keys.values() for code in codes}))],
+            ["country_id", "postcode", "latitude", "longitude"],
+        )
+        by_country = {}
+        by_postcode = {}
+        for centroid in centroids:
+            point = (centroid.latitude, centroid.longitude)
+            by_country[centroid.country_id.id, centroid.postcode] = point
+            by_postcode.setdefault(centroid.postcode, []).append(point)
+        result = {}
+        for property_id, (country_id, candidates) in keys.items():
+            for postcode in candidates:
+                if country_id:
+                    point = by_country.get((country_id, postcode))
+                else:
+                    # Without a country, only an unambiguous postcode is used.
+                    points = by_postcode.get(postcode, [])
+                    point = points[0] if len(points) == 1 else None
+                if point:
+                    result[property_id] = point
+                    break
+        return result
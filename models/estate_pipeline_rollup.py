@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+import logging
+from datetime import timedelta
+
+from odoo import api, fields, models
+from odoo.tools import SQL
+
+
+_logger = logging.getLogger(__name__)
+
+WATERMARK_PARAM = "hexclad_estate.pipeline_rollup_watermark"
+# Changes are re-read this far before the watermark, so that rows written by
+# transactions that were still running at the previous refresh (and thus
+# carry an older write_date) are not missed. Refreshing a row is idempotent.
+WATERMARK_OVERLAP = timedelta(minutes=10)
+# Grouping key of the fact and rollup tables; missing ids are stored as 0 in
+# the fact table so that keys compare with plain equality.
+GROUP_COLUMNS = ("stage_id", "user_id", "property_type_id", "company_id", "month")
+
+
+class EstatePipelineRollup(models.Model):
+    """
+    Materialized pipeline totals by stage, salesperson, property type and
+    month, backing the pipeline dashboard.
+
+    Rows are only written by ``_refresh``, which keeps one row per active
+    property in the ``estate_pipeline_fact`` table and re-aggregates only the
+    groups whose properties changed since the last refresh. Deleted
+    properties are queued in ``estate_pipeline_deleted_property`` by
+    ``estate.property.unlink``.
+    """
+
+    _name = "estate.pipeline.rollup"
+    _description = "Real Estate Pipeline Rollup"
+    _log_access = False
+    _order = "month desc, stage_id"
+
+    stage_id = fields.Many2one("estate.property.stage", string="Stage", readonly=True)
+    user_id = fields.Many2one("res.users", string="Salesperson", readonly=True)
+    property_type_id = fields.Many2one("estate.property.type", string="Property Type", readonly=True)
+    company_id = fields.Many2one("res.company", string="Company", readonly=True)
+    month = fields.Date(string="Month", readonly=True)
+    property_count = fields.Integer(string="Properties", readonly=True)
+    expected_price = fields.Float(string="Expected Price", readonly=True)
+    selling_price = fields.Float(string="Selling Price", readonly=True)
+    best_price = fields.Float(string="Best Offer", readonly=True)
+    potential_profit = fields.Float(string="Potential Profit", readonly=True)
+
+    def init(self):
+        self.env.cr.execute(
+            """
+            CREATE TABLE IF NOT EXISTS estate_pipeline_fact (
+                property_id integer PRIMARY KEY,
+                stage_id integer NOT NULL,
+                user_id integer NOT NULL,
+                property_type_id integer NOT NULL,
+                company_id integer NOT NULL,
+                month date NOT NULL,
+                expected_price double precision NOT NULL,
+                selling_price double precision NOT NULL,
+                best_price double precision NOT NULL,
+                potential_profit double precision NOT NULL
+            )
+            """
+        )
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS estate_pipeline_fact_group_index
+                ON estate_pipeline_fact (stage_id, user_id, property_type_id, company_id, month)
+            """
+        )
+        self.env.cr.execute(
+            """
+            CREATE TABLE IF NOT EXISTS estate_pipeline_deleted_property (
+                property_id integer NOT NULL
+            )
+            """
+        )
+
+    # ----------------------------------------
+    # Business Methods
+    # ----------------------------------------
+
+    @api.model
+    def _cron_refresh(self, full=False):
+        self._refresh(full=full)
+
+    @api.model
+    def _refresh(self, full=False):
+        """Bring the rollup up to date with the properties and their offers.
+
+        Incrementally, only the properties written (or whose offers were
+        written) since the watermark are re-read, and only the groups they
+        left or entered are re-aggregated. Without a watermark, or with
+        ``full``, both tables are rebuilt; the nightly full refresh also
+        realigns groups whose stage, type or salesperson was deleted, and
+        drops properties deleted without the ORM. Concurrent refreshes are
+        skipped.
+        """
+        cr = self.env.cr
+        cr.execute(SQL("SELECT pg_try_advisory_xact_lock(hashtext(%s))", WATERMARK_PARAM))
+        if not cr.fetchone()[0]:
+            _logger.info("Pipeline rollup refresh already running, skipped")
+            return
+        self.env["estate.property"].flush_model()
+        self.env["estate.property.offer"].flush_model(["property_id"])
+        params = self.env["ir.config_parameter"].sudo()
+        watermark = params.get_param(WATERMARK_PARAM)
+        now = cr.now()
+        if full or not watermark:
+            self._rebuild()
+        else:
+            since = fields.Datetime.to_datetime(watermark) - WATERMARK_OVERLAP
+            cr.execute(SQL(
+                """
+                WITH deleted AS (
+                    DELETE FROM estate_pipeline_deleted_property RETURNING property_id
+                )
+                SELECT id FROM estate_property WHERE write_date >= %s
+                 UNION
+                SELECT property_id FROM estate_property_offer WHERE write_date >= %s
+                 UNION
+                SELECT property_id FROM deleted
+                """,
+                since,
+                since,
+            ))
+            property_ids = [row[0] for row in cr.fetchall()]
+            self._refresh_properties(property_ids)
+        params.set_param(WATERMARK_PARAM, fields.Datetime.to_string(now))
+        self.invalidate_model()
+
+    @api.model
+    def _queue_deleted_properties(self, property_ids):
+        """Queue deleted properties for removal on the next refresh, so that
+        incremental refreshes never scan the whole fact table for them."""
+        if property_ids:
+            self.env.cr.execute(SQL(
+                "INSERT INTO estate_pipeline_deleted_property (property_id) SELECT unnest(%s::int[])",
+                property_ids,
+            ))
+
+    def _fact_select_sql(self, condition):
+        return SQL(
+            """
+            SELECT p.id, COALESCE(p.stage_id, 0), COALESCE(p.user_id, 0),
+                   COALESCE(p.property_type_id, 0), COALESCE(p.company_id, 0),
+                   date_trunc('month', COALESCE(p.date_created, p.create_date::date))::date,
+                   COALESCE(p.expected_price, 0), COALESCE(p.selling_price, 0),
+                   COALESCE(p.best_price, 0), COALESCE(p.potential_profit, 0)
+              FROM estate_property p
+             WHERE p.active AND %s
+            """,
+            condition,
+        )
+
+    def _aggregate_sql(self, condition):
+        """INSERT the rollup rows of the fact rows matching ``condition``.
+
+        Dimensions are joined so that ids deleted since the fact was read
+        (e.g. a removed property type) roll up as empty instead of breaking
+        the foreign keys.
+        """
+        return SQL(
+            """
+            INSERT INTO estate_pipeline_rollup (
+                stage_id, user_id, property_type_id, company_id, month, property_count,
+                expected_price, selling_price, best_price, potential_profit
+            )
+            SELECT stage.id, users.id, ptype.id, company.id, f.month, count(*),
+                   sum(f.expected_price), sum(f.selling_price), sum(f.best_price),
+                   sum(f.potential_profit)
+              FROM estate_pipeline_fact f
+              LEFT JOIN estate_property_stage stage ON stage.id = f.stage_id
+              LEFT JOIN res_users users ON users.id = f.user_id
+              LEFT JOIN estate_property_type ptype ON ptype.id = f.property_type_id
+              LEFT JOIN res_company company ON company.id = f.company_id
+             WHERE %s
+             GROUP BY f.stage_id, f.user_id, f.property_type_id, f.company_id, f.month,
+                      stage.id, users.id, ptype.id, company.id
+            """,
+            condition,
+        )
+
+    def _rebuild(self):
+        cr = self.env.cr
+        cr.execute("TRUNCATE estate_pipeline_fact")
+        # Not truncated: a TRUNCATE would wait for every running unlink.
+        cr.execute("DELETE FROM estate_pipeline_deleted_property")
+        cr.execute(SQL(
+            "INSERT INTO estate_pipeline_fact %s", self._fact_select_sql(SQL("TRUE"))
+        ))
+        cr.execute("DELETE FROM estate_pipeline_rollup")
+        cr.execute(self._aggregate_sql(SQL("TRUE")))
+        _logger.info("Pipeline rollup rebuilt: %s groups", cr.rowcount)
+
+    def _refresh_properties(self, property_ids):
+        """Re-read the facts of ``property_ids`` (deleted properties just lose
+        theirs) and re-aggregate every group they left or entered."""
+        if not property_ids:
+            return
+        cr = self.env.cr
+        returning = SQL(", ").join(SQL.identifier(column) for column in GROUP_COLUMNS)
+        keys = set()
+        cr.execute(SQL(
+            "DELETE FROM estate_pipeline_fact WHERE property_id = ANY(%s) RETURNING %s",
+            property_ids,
+            returning,
+        ))
+        keys.update(cr.fetchall())
+        cr.execute(SQL(
+            "INSERT INTO estate_pipeline_fact %s RETURNING %s",
+            self._fact_select_sql(SQL("p.id = ANY(%s)", property_ids)),
+            returning,
+        ))
+        keys.update(cr.fetchall())
+        if not keys:
+            return
+        stage_ids, user_ids, type_ids, company_ids, months = (list(column) for column in zip(*keys))
+        key_table = SQL(
+            "unnest(%s::int[], %s::int[], %s::int[], %s::int[], %s::date[])"
+            " AS k(stage_id, user_id, property_type_id, company_id, month)",
+            stage_ids,
+            user_ids,
+            type_ids,
+            company_ids,
+            months,
+        )
+        cr.execute(SQL(
+            """
+            DELETE FROM estate_pipeline_rollup r
+             USING %s
+             WHERE COALESCE(r.stage_id, 0) = k.stage_id
+               AND COALESCE(r.user_id, 0) = k.user_id
+               AND COALESCE(r.property_type_id, 0) = k.property_type_id
+               AND COALESCE(r.company_id, 0) = k.company_id
+               AND r.month = k.month
+            """,
+            key_table,
+        ))
+        cr.execute(self._aggregate_sql(SQL(
+            """
+            (f.stage_id, f.user_id, f.property_type_id, f.company_id, f.month) IN (
+                SELECT k.stage_id, k.user_id, k.property_type_id, k.company_id, k.month FROM %s
+            )
+            """,
+            key_table,
+        )))
+        _logger.info(
+            "Pipeline rollup refreshed: %s properties, %s groups", len(property_ids), len(keys)
+        )
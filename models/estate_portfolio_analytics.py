@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+from odoo import api, models
+from odoo.exceptions import UserError
+from odoo.tools import SQL
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Investment columns loaded for the analysis, in array column order.
+INVESTMENT_COLUMNS = (
+    "purchase_price",
+    "arv",
+    "rehab_cost",
+    "closing_costs",
+    "holding_costs",
+    "monthly_rent",
+    "monthly_expenses",
+)
+# Scenario shocks: "<column>_pct" changes a column by a percentage, and
+# "rate_delta" moves the financing rate by that many percentage points.
+SCENARIO_SHOCKS = tuple(f"{column}_pct" for column in INVESTMENT_COLUMNS) + ("rate_delta",)
+
+
+class EstatePortfolioAnalytics(models.AbstractModel):
+    """
+    Portfolio-wide flip and rental metrics with what-if scenarios.
+
+    The investment columns of every property in scope are loaded with one
+    query into NumPy arrays, and all scenarios are evaluated together as
+    (scenario x property) arrays: no per-record Python loop, and no ORM record
+    is instantiated.
+    """
+
+    _name = "estate.portfolio.analytics"
+    _description = "Real Estate Portfolio Analytics"
+
+    @api.model
+    def _load_investment_arrays(self, domain=None):
+        """Return ``(ids, columns)`` for the properties matching ``domain``:
+        an id array and a ``{column: float array}`` dict, NULLs read as 0."""
+        if np is None:
+            raise UserError(
+                "Portfolio analytics require the NumPy Python library, which is not installed."
+            )
+        Property = self.env["estate.property"]
+        Property.flush_model(list(INVESTMENT_COLUMNS))
+        query = Property._search(domain or [])
+        self.env.cr.execute(SQL(
+            "SELECT id, %s FROM estate_property WHERE id IN %s ORDER BY id",
+            SQL(", ").join(
+                SQL("COALESCE(%s, 0)", SQL.identifier(column)) for column in INVESTMENT_COLUMNS
+            ),
+            query.subselect(),
+        ))
+        rows = self.env.cr.fetchall()
+        data = np.array(rows, dtype=np.float64).reshape(len(rows), len(INVESTMENT_COLUMNS) + 1)
+        ids = data[:, 0].astype(np.int64)
+        return ids, {column: data[:, index + 1] for index, column in enumerate(INVESTMENT_COLUMNS)}
+
+    @api.model
+    def _analyze(self, domain=None, scenarios=None, holding_months=6, loan_to_value=0.75):
+        """Compute investment metrics of a portfolio under what-if scenarios.
+
+        ``scenarios`` maps a name to its shocks (see ``SCENARIO_SHOCKS``), e.g.
+        ``{"rates_up": {"rate_delta": 1}, "rehab_overrun": {"rehab_cost_pct": 15}}``;
+        the unshocked ``"base"`` scenario is always included, so no scenario
+        may take that name. Financing covers ``loan_to_value`` of the purchase
+        and rehab, so a rate change costs interest on it: over
+        ``holding_months`` for flips, and every month for rentals.
+
+        Returns ``{"ids": [...], "scenarios": {name: {"aggregate": {...},
+        "delta": {...}, "properties": {metric: [...]}}}}``, where per-property
+        lists follow ``ids`` and ``delta`` is the aggregate change from base.
+        """
+        scenarios = scenarios or {}
+        if "base" in scenarios:
+            raise UserError(
+                'The "base" scenario is the unshocked portfolio; name your scenario differently.'
+            )
+        scenarios = {"base": {}, **scenarios}
+        for name, shocks in scenarios.items():
+            unknown = set(shocks) - set(SCENARIO_SHOCKS)
+            if unknown:
+                raise UserError(
+                    f"Unknown shocks in scenario {name!r}: {', '.join(sorted(unknown))}.\n"
+                    f"Available shocks: {', '.join(SCENARIO_SHOCKS)}."
+                )
+        ids, columns = self._load_investment_arrays(domain)
+
+        # One row per scenario, broadcast against one column per property.
+        def factor(column):
+            return np.array(
+                [[1 + shocks.get(f"{column}_pct", 0) / 100] for shocks in scenarios.values()]
+            )
+
+        values = {column: factor(column) * array for column, array in columns.items()}
+        rate_delta = np.array([[shocks.get("rate_delta", 0) / 100] for shocks in scenarios.values()])
+        annual_extra_interest = (
+            (values["purchase_price"] + values["rehab_cost"]) * loan_to_value * rate_delta
+        )
+
+        total_investment = values["purchase_price"] + values["rehab_cost"] + values["closing_costs"]
+        potential_profit = values["arv"] - total_investment
+        net_profit = (
+            potential_profit
+            - values["holding_costs"] * holding_months
+            - annual_extra_interest * holding_months / 12
+        )
+        monthly_cash_flow = (
+            values["monthly_rent"] - values["monthly_expenses"] - annual_extra_interest / 12
+        )
+        annual_cash_flow = monthly_cash_flow * 12
+        metrics = {
+            "total_investment": total_investment,
+            "potential_profit": potential_profit,
+            "roi_percentage": _percent(potential_profit, total_investment),
+            "net_profit": net_profit,
+            "net_roi_percentage": _percent(net_profit, total_investment),
+            "monthly_cash_flow": monthly_cash_flow,
+            "annual_cash_flow": annual_cash_flow,
+            "cap_rate": _percent(annual_cash_flow, values["purchase_price"]),
+        }
+
+        invested = total_investment.sum(axis=1)
+        purchased = values["purchase_price"].sum(axis=1)
+        has_rows = bool(len(ids))
+        aggregates = {
+            "count": np.full(len(scenarios), len(ids)),
+            "total_investment": invested,
+            "potential_profit": potential_profit.sum(axis=1),
+            "net_profit": net_profit.sum(axis=1),
+            "portfolio_roi_percentage": _percent(potential_profit.sum(axis=1), invested),
+            "portfolio_net_roi_percentage": _percent(net_profit.sum(axis=1), invested),
+            "median_roi_percentage": (
+                np.median(metrics["roi_percentage"], axis=1) if has_rows else np.zeros(len(scenarios))
+            ),
+            "annual_cash_flow": annual_cash_flow.sum(axis=1),
+            "portfolio_cap_rate": _percent(annual_cash_flow.sum(axis=1), purchased),
+            "loss_count": (net_profit < 0).sum(axis=1),
+            "negative_cash_flow_count": (monthly_cash_flow < 0).sum(axis=1),
+        }
+
+        result = {"ids": ids.tolist(), "scenarios": {}}
+        for index, name in enumerate(scenarios):
+            aggregate = {key: array[index].item() for key, array in aggregates.items()}
+            result["scenarios"][name] = {
+                "aggregate": aggregate,
+                "delta": {
+                    key: (array[index] - array[0]).item()
+                    for key, array in aggregates.items()
+                    if key != "count"
+                },
+                "properties": {key: array[index].tolist() for key, array in metrics.items()},
+            }
+        return result
+
+
+def _percent(numerator, denominator):
+    """``numerator / denominator * 100`` element-wise, 0 where the
+    denominator is not positive (as in the stored ROI and cap rate)."""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.broadcast_to(np.asarray(denominator, dtype=np.float64), numerator.shape)
+    return np.divide(
+        numerator * 100,
+        denominator,
+        out=np.zeros(numerator.shape),
+        where=denominator > 0,
+    )
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+from odoo import api, fields, models
+
+from ..tools.geo import normalize_postcode
+
+
+class EstatePostcodeCentroid(models.Model):
+    """
+    Reference coordinates of postcodes, used to geocode properties offline.
+    Load it from a postcode gazetteer export (e.g. GeoNames postal codes) with
+    the standard CSV import.
+    """
+
+    _name = "estate.postcode.centroid"
+    _description = "Postcode Centroid"
+    _order = "country_id, postcode"
+    _rec_name = "postcode"
+
+    _sql_constraints = [
+        (
+            "postcode_country_unique",
+            "UNIQUE(country_id, postcode)",
+            "A postcode can only have one centroid per country",
+        ),
+    ]
+
+    country_id = fields.Many2one("res.country", string="Country", required=True, index=True)
+    postcode = fields.Char(string="Postcode", required=True, index=True)
+    place_name = fields.Char(string="Place")
+    latitude = fields.Float(string="Latitude", digits=(10, 7), required=True)
+    longitude = fields.Float(string="Longitude", digits=(10, 7), required=True)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        for vals in vals_list:
+            if vals.get("postcode"):
+                vals["postcode"] = normalize_postcode(vals["postcode"])
+        return super().create(vals_list)
+
+    def write(self, vals):
+        if vals.get("postcode"):
+            vals["postcode"] = normalize_postcode(vals["postcode"])
+        return super().write(vals)
@@ -2,11 +2,44 @@
 
 from odoo import api, fields, models
 from odoo.exceptions import UserError, ValidationError
-from odoo.tools import float_compare, float_is_zero
+from odoo.tools import SQL, float_compare, float_is_zero
+from odoo.tools.sql import create_index
+from collections import defaultdict
+from collections.abc import Collection
 from dateutil.relativedelta import relativedelta
+from psycopg2 import errors
 import re
 import unicodedata
 
+from ..tools.geo import EARTH_RADIUS_KM, bbox_around, geohash_cover, geohash_encode
+from ..tools.render_cache import detail_cache
+from .estate_property_stage import STATE_STAGE_XML_IDS
+
+# Text search configuration of the ``search_vector`` column.
+FULLTEXT_CONFIG = "english"
+# Fields feeding ``search_vector``; writing any of them refreshes it.
+FULLTEXT_FIELDS = ("name", "description", "city", "street", "tag_ids")
+# Stored computed fields that _bulk_recompute_investment_fields computes in
+# SQL, and the fields they are computed from.
+BULK_RECOMPUTE_FIELDS = (
+    "total_area",
+    "potential_profit",
+    "roi_percentage",
+    "monthly_cash_flow",
+    "annual_cash_flow",
+    "cap_rate",
+)
+BULK_RECOMPUTE_INPUTS = (
+    "living_area",
+    "garden_area",
+    "arv",
+    "purchase_price",
+    "rehab_cost",
+    "closing_costs",
+    "monthly_rent",
+    "monthly_expenses",
+)
+
 
 def _slugify(value):
     value = value or ""
@@ -22,14 +55,6 @@ def _record_slug(record):
     return f"{slugname}-{record.id}" if record.id else slugname
 
 
-STATE_STAGE_XML_IDS = {
-    "new": "stage_new",
-    "offer_received": "stage_offer",
-    "offer_accepted": "stage_under_contract",
-    "sold": "stage_won",
-    "canceled": "stage_lost",
-}
-
 
 class EstateProperty(models.Model):
     """
@@ -61,6 +86,56 @@ class EstateProperty(models.Model):
         ),
     ]
     
+    def init(self):
+        # Partial indexes backing the public /properties listing: every page is
+        # an ``id desc`` keyset scan over published, active rows, optionally
+        # narrowed by property type and/or state.
+        published = "is_published AND active"
+        for suffix, expressions in (
+            ("id", ["id DESC"]),
+            ("type", ["property_type_id", "id DESC"]),
+            ("state", ["state", "id DESC"]),
+            ("type_state", ["property_type_id", "state", "id DESC"]),
+        ):
+            create_index(
+                self.env.cr,
+                f"estate_property_published_{suffix}_index",
+                self._table,
+                expressions,
+                where=published,
+            )
+
+        # Weighted full-text vector, maintained in SQL by
+        # ``_update_search_vector`` and matched through a GIN index. Existing
+        # rows are filled by the install hook and migration, once the tag
+        # tables it reads exist (see hooks.backfill_search_vectors).
+        self.env.cr.execute(
+            "ALTER TABLE estate_property ADD COLUMN IF NOT EXISTS search_vector tsvector"
+        )
+        create_index(
+            self.env.cr,
+            "estate_property_search_vector_index",
+            self._table,
+            ["search_vector"],
+            method="gin",
+        )
+
+        # Spatial lookups (see _bbox_domain): bounding boxes range-scan the
+        # coordinates and prefix-match the geohash cells covering them.
+        create_index(
+            self.env.cr,
+            "estate_property_latitude_longitude_index",
+            self._table,
+            ["latitude", "longitude"],
+        )
+        create_index(
+            self.env.cr,
+            "estate_property_geohash_index",
+            self._table,
+            ["geohash text_pattern_ops"],
+            where="geohash IS NOT NULL",
+        )
+
     # ----------------------------------------
     # Default Methods
     # ----------------------------------------
@@ -78,24 +153,19 @@ class EstateProperty(models.Model):
 
     def _get_stage_id(self, xml_id):
         """Return stage ID for a given XML ID or False if not found."""
+        for state, state_xml_id in STATE_STAGE_XML_IDS.items():
+            if state_xml_id == xml_id:
+                return self._get_stage_id_for_state(state)
         stage = self.env.ref(f"hexclad_estate.{xml_id}", raise_if_not_found=False)
         return stage.id if stage else False
 
     def _get_stage_id_for_state(self, state):
         """Return stage ID for a given property state."""
-        xml_id = STATE_STAGE_XML_IDS.get(state)
-        if not xml_id:
-            return False
-        return self._get_stage_id(xml_id)
+        return self.env["estate.property.stage"]._get_stage_id_for_state(state)
 
     def _get_default_stage_ids(self):
         """Return a list of stage IDs in the default workflow order."""
-        stage_ids = []
-        for xml_id in STATE_STAGE_XML_IDS.values():
-            stage_id = self._get_stage_id(xml_id)
-            if stage_id:
-                stage_ids.append(stage_id)
-        return stage_ids
+        return self.env["estate.property.stage"]._get_default_stage_ids()
     
     @api.model
     def _read_group_stage_ids(self, stages, domain):
@@ -124,7 +194,7 @@ class EstateProperty(models.Model):
     # Address fields
     street = fields.Char(string="Street")
     street2 = fields.Char(string="Street 2")
-    city = fields.Char(string="City")
+    city = fields.Char(string="City", index=True)
     state_id = fields.Many2one(
         "res.country.state",
         string="State",
@@ -137,6 +207,17 @@ class EstateProperty(models.Model):
         ondelete="restrict",
         default=lambda self: self.env.company.country_id,
     )
+
+    # Location
+    # Filled by the estate.geocoder from the postcode; (0, 0) means the
+    # property is not located, as for partner coordinates.
+    latitude = fields.Float(string="Latitude", digits=(10, 7))
+    longitude = fields.Float(string="Longitude", digits=(10, 7))
+    geohash = fields.Char(
+        string="Geohash",
+        compute="_compute_geohash",
+        store=True,
+    )
     
     # Dates
     date_availability = fields.Date(
@@ -151,9 +232,24 @@ class EstateProperty(models.Model):
     )
     
     # Pricing
-    expected_price = fields.Float(string="Expected Price", required=True, tracking=True)
+    expected_price = fields.Float(string="Expected Price", required=True, tracking=True, index=True)
     selling_price = fields.Float(string="Selling Price", readonly=True, copy=False, tracking=True)
-    best_price = fields.Float(string="Best Offer", compute="_compute_best_price")
+    best_price = fields.Float(
+        string="Best Offer",
+        compute="_compute_offer_stats",
+        store=True,
+        index=True,
+    )
+    offer_count = fields.Integer(
+        string="Offer Count",
+        compute="_compute_offer_stats",
+        store=True,
+    )
+    last_offer_date = fields.Datetime(
+        string="Latest Offer",
+        compute="_compute_offer_stats",
+        store=True,
+    )
     
     # Investment Analysis Fields (for NDWCM RE Group)
     purchase_price = fields.Float(string="Purchase Price", help="Actual or estimated purchase price")
@@ -195,7 +291,7 @@ class EstateProperty(models.Model):
     )
     
     # Property Details
-    bedrooms = fields.Integer(string="Bedrooms", default=0)
+    bedrooms = fields.Integer(string="Bedrooms", default=0, index=True)
     bathrooms = fields.Float(string="Bathrooms", default=0)
     living_area = fields.Integer(string="Living Area (sqft)")
     lot_size = fields.Integer(string="Lot Size (sqft)")
@@ -277,12 +373,41 @@ class EstateProperty(models.Model):
     
     # Images
     image = fields.Image(string="Main Image", max_width=1920, max_height=1920)
+    # Precomputed variants served to listing cards and gallery thumbnails.
+    image_1024 = fields.Image(
+        string="Main Image 1024", related="image", max_width=1024, max_height=1024, store=True
+    )
+    image_512 = fields.Image(
+        string="Main Image 512", related="image", max_width=512, max_height=512, store=True
+    )
+    image_256 = fields.Image(
+        string="Main Image 256", related="image", max_width=256, max_height=256, store=True
+    )
+    image_128 = fields.Image(
+        string="Main Image 128", related="image", max_width=128, max_height=128, store=True
+    )
     image_ids = fields.One2many(
         "estate.property.image",
         "property_id",
         string="Images",
     )
 
+    # Website
+    # Stored so that listings, the sitemap and slug resolution read a plain
+    # indexed column instead of slugifying the name on every read.
+    website_url = fields.Char(
+        compute="_compute_website_url",
+        store=True,
+        index=True,
+        copy=False,
+    )
+    # Keyword search over the ``search_vector`` column; never read.
+    fulltext = fields.Char(
+        string="Keywords",
+        compute="_compute_fulltext",
+        search="_search_fulltext",
+    )
+
     # Utilities & Risk
     survey_complete = fields.Boolean(string="Survey Complete")
     flood_zone = fields.Boolean(string="Flood Zone")
@@ -304,15 +429,34 @@ class EstateProperty(models.Model):
         for record in self:
             record.total_area = record.living_area + record.garden_area
     
-    @api.depends("offer_ids.price")
-    def _compute_best_price(self):
+    @api.depends("offer_ids", "offer_ids.price")
+    def _compute_offer_stats(self):
+        # Offers stay access-restricted; only these aggregates are computed with
+        # sudo. Only the properties whose offers changed are recomputed, with a
+        # single grouped query for all of them.
+        stored = self.filtered("id")
+        stats = {}
+        if stored.ids:
+            groups = self.env["estate.property.offer"].sudo()._read_group(
+                [("property_id", "in", stored.ids)],
+                ["property_id"],
+                ["price:max", "__count", "create_date:max"],
+            )
+            stats = {
+                property_record.id: (best_price, count, last_date)
+                for property_record, best_price, count, last_date in groups
+            }
         for record in self:
-            # Offers stay access-restricted; only this aggregate is computed with sudo.
-            offers = record.sudo().offer_ids
-            if offers:
-                record.best_price = max(offers.mapped("price"))
+            if record.id:
+                best_price, count, last_date = stats.get(record.id, (0.0, 0, False))
             else:
-                record.best_price = 0.0
+                offers = record.sudo().offer_ids
+                best_price = max(offers.mapped("price"), default=0.0)
+                count = len(offers)
+                last_date = max(offers.filtered("create_date").mapped("create_date"), default=False)
+            record.best_price = best_price or 0.0
+            record.offer_count = count
+            record.last_offer_date = last_date
     
     @api.depends("arv", "purchase_price", "rehab_cost", "closing_costs")
     def _compute_potential_profit(self):
@@ -341,6 +485,37 @@ class EstateProperty(models.Model):
     def _compute_website_url(self):
         for record in self:
             record.website_url = f"/properties/{_record_slug(record)}"
+
+    @api.depends("latitude", "longitude")
+    def _compute_geohash(self):
+        for record in self:
+            if record.latitude or record.longitude:
+                record.geohash = geohash_encode(record.latitude, record.longitude)
+            else:
+                record.geohash = False
+
+    def _compute_fulltext(self):
+        self.fulltext = False
+
+    def _search_fulltext(self, operator, value):
+        # The domain optimizer turns ("fulltext", "=", text) into an "in" of
+        # that single text before calling this method.
+        if operator == "in" and isinstance(value, Collection) and len(value) == 1:
+            operator, value = "=", next(iter(value))
+        if operator not in ("=", "ilike", "like") or not isinstance(value, str):
+            return NotImplemented
+        if not value.strip():
+            return []
+        # Match as a subquery so the GIN index is used and large result sets
+        # are never materialized in Python.
+        query = self.sudo().with_context(active_test=False)._search([])
+        query.add_where(SQL(
+            "%s @@ websearch_to_tsquery(%s::regconfig, %s)",
+            SQL.identifier(query.table, "search_vector"),
+            FULLTEXT_CONFIG,
+            value,
+        ))
+        return [("id", "in", query)]
     
     # ----------------------------------------
     # Onchange Methods
@@ -388,15 +563,50 @@ class EstateProperty(models.Model):
                 stage_id = self._get_stage_id_for_state(state)
                 if stage_id:
                     vals["stage_id"] = stage_id
-        return super().create(vals_list)
+        records = super().create(vals_list)
+        if self.env.context.get("estate_bulk_recompute"):
+            records._bulk_recompute_investment_fields()
+        records._update_search_vector()
+        records.browse([
+            record.id
+            for record, vals in zip(records, vals_list)
+            if "latitude" not in vals and "longitude" not in vals
+        ])._geocode()
+        return records
 
     def write(self, vals):
         if "state" in vals and "stage_id" not in vals:
             stage_id = self._get_stage_id_for_state(vals.get("state"))
             if stage_id:
                 vals["stage_id"] = stage_id
-        return super().write(vals)
+        res = super().write(vals)
+        if self.env.context.get("estate_bulk_recompute") and any(
+            fname in vals for fname in BULK_RECOMPUTE_INPUTS
+        ):
+            self._bulk_recompute_investment_fields()
+        if any(fname in vals for fname in FULLTEXT_FIELDS):
+            self._update_search_vector()
+        if (
+            ("postcode" in vals or "country_id" in vals)
+            and "latitude" not in vals
+            and "longitude" not in vals
+        ):
+            self._geocode()
+        self._invalidate_website_cache()
+        return res
     
+    @api.model
+    def load(self, fields, data):
+        # Imports recompute the investment fields with one UPDATE per batch.
+        return super(EstateProperty, self.with_context(estate_bulk_recompute=True)).load(
+            fields, data
+        )
+
+    def unlink(self):
+        # Deleted properties leave the pipeline rollup on its next refresh.
+        self.env["estate.pipeline.rollup"]._queue_deleted_properties(self.ids)
+        return super().unlink()
+
     @api.ondelete(at_uninstall=False)
     def _unlink_if_not_new_or_canceled(self):
         for record in self:
@@ -405,57 +615,311 @@ class EstateProperty(models.Model):
                     "You cannot delete a property that is not in 'New' or 'Canceled' state."
                 )
     
+    # ----------------------------------------
+    # Business Methods
+    # ----------------------------------------
+
+    def _invalidate_website_cache(self, touch=False):
+        """Evict the cached public detail pages of these properties.
+
+        With ``touch``, also bump ``write_date`` so that pages cached by other
+        worker processes (keyed on it) stop matching. Used by changes to related
+        records that the detail page renders, such as images and offers.
+        """
+        if not self.ids:
+            return
+        if touch:
+            self.env.cr.execute(SQL(
+                "UPDATE estate_property SET write_date = %s WHERE id IN %s",
+                self.env.cr.now(),
+                tuple(self.ids),
+            ))
+            self.invalidate_recordset(["write_date"])
+        detail_cache.invalidate(self.env.cr.dbname, self.ids)
+
+    @api.model
+    def _search_vector_sql(self):
+        """SQL expression of the weighted search vector of row ``p``: title
+        (A), tags (B), address (C) and description (D)."""
+        tags = self._fields["tag_ids"]
+        return SQL(
+            """
+            setweight(to_tsvector(%(config)s::regconfig, coalesce(p.name, '')), 'A')
+            || setweight(to_tsvector(%(config)s::regconfig, coalesce((
+                SELECT string_agg(t.name, ' ')
+                  FROM estate_property_tag t
+                  JOIN %(relation)s r ON r.%(tag_column)s = t.id
+                 WHERE r.%(property_column)s = p.id
+            ), '')), 'B')
+            || setweight(to_tsvector(%(config)s::regconfig,
+                coalesce(p.city, '') || ' ' || coalesce(p.street, '')), 'C')
+            || setweight(to_tsvector(%(config)s::regconfig, coalesce(p.description, '')), 'D')
+            """,
+            config=FULLTEXT_CONFIG,
+            relation=SQL.identifier(tags.relation),
+            tag_column=SQL.identifier(tags.column2),
+            property_column=SQL.identifier(tags.column1),
+        )
+
+    def _update_search_vector(self):
+        """Recompute ``search_vector`` of these properties in one UPDATE."""
+        if not self.ids:
+            return
+        self.flush_recordset(list(FULLTEXT_FIELDS))
+        self.env["estate.property.tag"].flush_model(["name"])
+        self.env.cr.execute(SQL(
+            "UPDATE estate_property p SET search_vector = %s WHERE p.id IN %s",
+            self._search_vector_sql(),
+            tuple(self.ids),
+        ))
+
+    @api.model
+    def _search_fulltext_ranked(self, text, domain=None, limit=None, offset=0):
+        """Return the properties matching ``text`` and ``domain``, best match
+        first (``ts_rank_cd`` over the weighted vector, then newest)."""
+        query = self._search(domain or [])
+        self.env.cr.execute(SQL(
+            """
+            SELECT p.id
+              FROM estate_property p,
+                   websearch_to_tsquery(%s::regconfig, %s) q
+             WHERE p.search_vector @@ q
+               AND p.id IN %s
+             ORDER BY ts_rank_cd(p.search_vector, q) DESC, p.id DESC
+             LIMIT %s OFFSET %s
+            """,
+            FULLTEXT_CONFIG,
+            text,
+            query.subselect(),
+            limit,
+            offset,
+        ))
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    def _geocode(self):
+        """Locate these properties with the ``estate.geocoder``.
+
+        Properties it cannot locate are reset to "not located" rather than
+        keeping coordinates of a previous address. Properties sharing a point
+        (typically a postcode centroid) are written together.
+        """
+        if not self:
+            return
+        points = self.env["estate.geocoder"]._geocode_properties(self)
+        ids_by_point = defaultdict(list)
+        for record in self:
+            point = points.get(record.id, (0.0, 0.0))
+            if (record.latitude, record.longitude) != point:
+                ids_by_point[point].append(record.id)
+        for (latitude, longitude), ids in ids_by_point.items():
+            self.browse(ids).write({"latitude": latitude, "longitude": longitude})
+
+    @api.model
+    def _bbox_domain(self, south, west, north, east):
+        """Domain of the located properties inside a bounding box (degrees).
+
+        A box with ``west > east`` crosses the antimeridian.
+        """
+        domain = [
+            ("geohash", "!=", False),
+            ("latitude", ">=", south),
+            ("latitude", "<=", north),
+        ]
+        if west <= east:
+            domain += [("longitude", ">=", west), ("longitude", "<=", east)]
+        else:
+            domain += ["|", ("longitude", ">=", west), ("longitude", "<=", east)]
+        cells = geohash_cover(south, west, north, east)
+        if cells:
+            domain += ["|"] * (len(cells) - 1) + [
+                ("geohash", "=like", f"{cell}%") for cell in cells
+            ]
+        return domain
+
+    @api.model
+    def _distance_sql(self, alias, latitude, longitude):
+        """SQL haversine distance in km from the row ``alias`` to a point."""
+        row_latitude = SQL.identifier(alias, "latitude")
+        row_longitude = SQL.identifier(alias, "longitude")
+        return SQL(
+            """
+            2 * %s * asin(least(1.0, sqrt(
+                power(sin(radians(%s - %s) / 2), 2)
+                + cos(radians(%s)) * cos(radians(%s))
+                * power(sin(radians(%s - %s) / 2), 2)
+            )))
+            """,
+            EARTH_RADIUS_KM,
+            row_latitude,
+            latitude,
+            latitude,
+            row_latitude,
+            row_longitude,
+            longitude,
+        )
+
+    @api.model
+    def _radius_domain(self, latitude, longitude, radius_km):
+        """Domain of the properties within ``radius_km`` of a point.
+
+        The exact distance is only computed on the rows of the enclosing
+        bounding box, which the spatial indexes narrow down first.
+        """
+        query = self.sudo().with_context(active_test=False)._search(
+            self._bbox_domain(*bbox_around(latitude, longitude, radius_km))
+        )
+        query.add_where(SQL(
+            "%s <= %s",
+            self._distance_sql(query.table, latitude, longitude),
+            radius_km,
+        ))
+        return [("id", "in", query)]
+
+    @api.model
+    def _search_bbox(self, south, west, north, east, domain=None, limit=None):
+        """Return the properties matching ``domain`` inside a bounding box."""
+        return self.search((domain or []) + self._bbox_domain(south, west, north, east), limit=limit)
+
+    @api.model
+    def _search_radius(self, latitude, longitude, radius_km, domain=None, limit=None):
+        """Return ``[(property, distance in km)]`` for the properties matching
+        ``domain`` within ``radius_km`` of a point, nearest first."""
+        query = self._search(
+            (domain or []) + self._radius_domain(latitude, longitude, radius_km)
+        )
+        distance = self._distance_sql("p", latitude, longitude)
+        self.env.cr.execute(SQL(
+            """
+            SELECT p.id, %s AS distance
+              FROM estate_property p
+             WHERE p.id IN %s
+             ORDER BY distance, p.id
+             LIMIT %s
+            """,
+            distance,
+            query.subselect(),
+            limit,
+        ))
+        return [(self.browse(row[0]), row[1]) for row in self.env.cr.fetchall()]
+
+    def _bulk_recompute_investment_fields(self):
+        """Recompute the investment analysis fields and ``total_area`` of
+        these properties with a single set-based UPDATE.
+
+        Same formulas as ``_compute_total_area``, ``_compute_potential_profit``
+        and ``_compute_cash_flow``, without loading the records in Python: the
+        pending per-record computations are dropped and the cache of the
+        fields invalidated. Enabled on create and write by the
+        ``estate_bulk_recompute`` context key, which imports set.
+        """
+        if not self.ids:
+            return
+        self.check_access("write")
+        for fname in BULK_RECOMPUTE_FIELDS:
+            self.env.remove_to_compute(self._fields[fname], self)
+        self.flush_recordset(list(BULK_RECOMPUTE_INPUTS))
+        self.env.cr.execute(SQL(
+            """
+            UPDATE estate_property p
+               SET total_area = COALESCE(p.living_area, 0) + COALESCE(p.garden_area, 0),
+                   potential_profit = v.arv - v.investment,
+                   roi_percentage = CASE WHEN v.investment > 0
+                       THEN (v.arv - v.investment) / v.investment * 100 ELSE 0 END,
+                   monthly_cash_flow = v.cash_flow,
+                   annual_cash_flow = v.cash_flow * 12,
+                   cap_rate = CASE WHEN v.purchase_price > 0
+                       THEN v.cash_flow * 12 / v.purchase_price * 100 ELSE 0 END
+              FROM (
+                    SELECT id,
+                           COALESCE(arv, 0) AS arv,
+                           COALESCE(purchase_price, 0) AS purchase_price,
+                           COALESCE(purchase_price, 0) + COALESCE(rehab_cost, 0)
+                               + COALESCE(closing_costs, 0) AS investment,
+                           COALESCE(monthly_rent, 0) - COALESCE(monthly_expenses, 0) AS cash_flow
+                      FROM estate_property
+                     WHERE id = ANY(%s)
+                   ) v
+             WHERE p.id = v.id
+            """,
+            list(self.ids),
+        ))
+        self.invalidate_recordset(list(BULK_RECOMPUTE_FIELDS), flush=False)
+
+    def _lock_for_update(self):
+        """Lock the rows of these properties until the end of the transaction.
+
+        Fails fast with a UserError instead of waiting when another transaction
+        holds one of the rows (e.g. an agent accepting an offer on the same
+        property). Cached values are dropped, so that the checks following
+        the lock read the current state.
+        """
+        if not self.ids:
+            return
+        try:
+            with self.env.cr.savepoint():
+                self.env.cr.execute(SQL(
+                    "SELECT id FROM estate_property WHERE id IN %s ORDER BY id FOR UPDATE NOWAIT",
+                    tuple(self.ids),
+                ))
+        except errors.LockNotAvailable as e:
+            raise UserError(
+                "This property is being updated by someone else (another offer or an acceptance "
+                "in progress). Please try again in a moment."
+            ) from e
+        self.invalidate_recordset()
+
+    def _write_state(self, state, **extra_vals):
+        """Move the whole recordset to ``state`` and its stage in one write.
+
+        Workflow actions validate the recordset up front and then call this,
+        so a bulk transition costs a single UPDATE; tracking values are still
+        recorded per property by the write.
+        """
+        vals = dict(extra_vals, state=state)
+        stage_id = self._get_stage_id_for_state(state)
+        if stage_id:
+            vals["stage_id"] = stage_id
+        return self.write(vals)
+
     # ----------------------------------------
     # Action Methods
     # ----------------------------------------
 
     def action_offer_received(self):
         """Mark property as offer received."""
-        for record in self:
-            if record.state in ("sold", "canceled"):
-                raise UserError("You cannot receive offers on a sold or canceled property.")
-            record.write({"state": "offer_received"})
+        if self.filtered(lambda r: r.state in ("sold", "canceled")):
+            raise UserError("You cannot receive offers on a sold or canceled property.")
+        self._write_state("offer_received")
         return True
 
     def action_offer_accepted(self):
         """Mark property as offer accepted."""
-        for record in self:
-            if record.state in ("sold", "canceled"):
-                raise UserError("You cannot accept offers on a sold or canceled property.")
-            record.write({"state": "offer_accepted"})
+        if self.filtered(lambda r: r.state in ("sold", "canceled")):
+            raise UserError("You cannot accept offers on a sold or canceled property.")
+        self._write_state("offer_accepted")
         return True
     
     def action_sold(self):
         """Mark property as sold."""
-        for record in self:
-            if record.state == "canceled":
-                raise UserError("A canceled property cannot be sold.")
-            record.state = "sold"
-            stage_id = record._get_stage_id("stage_won")
-            if stage_id:
-                record.stage_id = stage_id
+        if self.filtered(lambda r: r.state == "canceled"):
+            raise UserError("A canceled property cannot be sold.")
+        self._write_state("sold")
         return True
     
     def action_cancel(self):
         """Cancel the property listing."""
-        for record in self:
-            if record.state == "sold":
-                raise UserError("A sold property cannot be canceled.")
-            record.state = "canceled"
-            stage_id = record._get_stage_id("stage_lost")
-            if stage_id:
-                record.stage_id = stage_id
+        if self.filtered(lambda r: r.state == "sold"):
+            raise UserError("A sold property cannot be canceled.")
+        self._write_state("canceled")
         return True
     
     def action_reset(self):
         """Reset property to new state."""
-        for record in self:
-            record.state = "new"
-            record.selling_price = 0
-            record.buyer_id = False
-            stage_id = record._get_stage_id("stage_new")
-            if stage_id:
-                record.stage_id = stage_id
+        self._write_state("new", selling_price=0, buyer_id=False)
+        return True
+
+    def action_geocode(self):
+        self._geocode()
         return True
 
     def action_open_website(self):
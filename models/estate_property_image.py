@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 
-from odoo import fields, models
+from odoo import api, fields, models
 
 
 class EstatePropertyImage(models.Model):
     _name = "estate.property.image"
+    _inherit = ["image.mixin"]
     _description = "Estate Property Image"
     _order = "sequence, id"
 
@@ -16,8 +17,28 @@ class EstatePropertyImage(models.Model):
         ondelete="cascade",
     )
     sequence = fields.Integer(default=10)
+    # Resized variants (image_1024 ... image_128) come from image.mixin and
+    # are stored once, when the original is uploaded.
     image_1920 = fields.Image(
         string="Image",
         max_width=1920,
         max_height=1920,
     )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        images = super().create(vals_list)
+        images.property_id._invalidate_website_cache(touch=True)
+        return images
+
+    def write(self, vals):
+        properties = self.property_id
+        res = super().write(vals)
+        (properties | self.property_id)._invalidate_website_cache(touch=True)
+        return res
+
+    def unlink(self):
+        properties = self.property_id
+        res = super().unlink()
+        properties.exists()._invalidate_website_cache(touch=True)
+        return res
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+import logging
+
+from markupsafe import Markup
+
+from odoo import api, fields, models
+from odoo.tools import html_escape
+
+
+_logger = logging.getLogger(__name__)
+
+
+class EstatePropertyInquiry(models.Model):
+    """
+    Website inquiries about a property.
+    The website controller only stores the submission; the side effects
+    (partner, chatter posts, CRM lead, salesperson email) are fanned out in
+    batches by a scheduled action.
+    """
+
+    # ----------------------------------------
+    # Private Attributes
+    # ----------------------------------------
+
+    _name = "estate.property.inquiry"
+    _description = "Real Estate Website Inquiry"
+    _order = "id desc"
+
+    # ----------------------------------------
+    # Fields Declaration
+    # ----------------------------------------
+
+    property_id = fields.Many2one(
+        "estate.property",
+        string="Property",
+        required=True,
+        ondelete="cascade",
+    )
+    name = fields.Char(string="Name", required=True)
+    email = fields.Char(string="Email")
+    phone = fields.Char(string="Phone")
+    message = fields.Text(string="Message")
+    state = fields.Selection(
+        selection=[
+            ("pending", "Pending"),
+            ("done", "Processed"),
+            ("failed", "Failed"),
+        ],
+        string="Status",
+        required=True,
+        default="pending",
+        index=True,
+        copy=False,
+    )
+    partner_id = fields.Many2one(
+        "res.partner",
+        string="Contact",
+        readonly=True,
+        copy=False,
+    )
+    date_processed = fields.Datetime(string="Processed On", readonly=True, copy=False)
+    error = fields.Text(string="Error", readonly=True, copy=False)
+
+    # ----------------------------------------
+    # Action Methods
+    # ----------------------------------------
+
+    def action_retry(self):
+        """Queue failed inquiries again."""
+        self.write({"state": "pending", "error": False})
+        self._trigger_processing()
+        return True
+
+    # ----------------------------------------
+    # Business Methods
+    # ----------------------------------------
+
+    @api.model
+    def _trigger_processing(self):
+        cron = self.env.ref(
+            "hexclad_estate.ir_cron_process_estate_inquiries", raise_if_not_found=False
+        )
+        if cron:
+            cron.sudo()._trigger()
+
+    @api.model
+    def _cron_process_inquiries(self, batch_size=100):
+        """Process one batch of pending inquiries and reschedule if more remain."""
+        inquiries = self.search([("state", "=", "pending")], order="id", limit=batch_size)
+        inquiries._process()
+        if self.search_count([("state", "=", "pending")], limit=1):
+            self._trigger_processing()
+
+    def _process(self):
+        """Run the side effects of each inquiry in its own savepoint, so one
+        failing inquiry is flagged without losing the rest of the batch."""
+        for inquiry in self:
+            try:
+                with self.env.cr.savepoint():
+                    inquiry._dispatch()
+            except Exception as e:
+                _logger.exception("Failed to process website inquiry %s", inquiry.id)
+                inquiry.write({"state": "failed", "error": str(e)})
+            else:
+                inquiry.write({"state": "done", "date_processed": fields.Datetime.now()})
+
+    def _dispatch(self):
+        self.ensure_one()
+        property = self.property_id.sudo()
+        name = self.name
+        email = self.email or ""
+        phone = self.phone or ""
+        message = self.message or ""
+        base_url = property.get_base_url()
+        property_url = (
+            f"{base_url}{property.website_url}"
+            if base_url and property.website_url
+            else ""
+        )
+        partner = self.env["res.partner"].sudo()._find_or_create_inquiry_partner(
+            name, email, phone
+        )
+        self.partner_id = partner
+
+        def _display(value):
+            return html_escape(value) if value else "—"
+
+        property_address = ", ".join(
+            filter(
+                None,
+                [
+                    property.street,
+                    property.street2,
+                    property.city,
+                    property.state_id.name if property.state_id else False,
+                    property.postcode,
+                    property.country_id.name if property.country_id else False,
+                ],
+            )
+        )
+        property_url_html = (
+            f'<a href="{html_escape(property_url)}">{html_escape(property_url)}</a>'
+            if property_url
+            else "—"
+        )
+        message_html = html_escape(message or "—").replace("\n", "<br/>")
+        body = Markup(
+            f"""
+            <p><strong>Website Inquiry</strong></p>
+            <ul>
+              <li><strong>Name:</strong> {_display(name)}</li>
+              <li><strong>Email:</strong> {_display(email)}</li>
+              <li><strong>Phone:</strong> {_display(phone)}</li>
+              <li><strong>Property:</strong> {_display(property.name)}</li>
+              <li><strong>Address:</strong> {_display(property_address)}</li>
+              <li><strong>Property URL:</strong> {property_url_html}</li>
+            </ul>
+            <p><strong>Message:</strong></p>
+            <p>{message_html}</p>
+        """
+        )
+
+        salesperson_partner = (
+            property.user_id.partner_id if property.user_id else False
+        )
+        partner_ids = [salesperson_partner.id] if salesperson_partner else []
+
+        property.message_post(
+            body=body,
+            message_type="comment",
+            subtype_xmlid="mail.mt_comment",
+            author_id=partner.id,
+            email_from=email or False,
+            partner_ids=partner_ids,
+        )
+
+        if "crm.lead" in self.env.registry.models:
+            Lead = self.env["crm.lead"].sudo()
+            stage = self.env["crm.stage"].sudo().search(
+                [("name", "=", "New Prospect")], limit=1
+            )
+            if not stage:
+                stage = self.env["crm.stage"].sudo().search(
+                    [], order="sequence,id", limit=1
+                )
+            description_lines = [
+                "Website Inquiry",
+                f"Name: {name or '—'}",
+                f"Email: {email or '—'}",
+                f"Phone: {phone or '—'}",
+                f"Property: {property.name or '—'}",
+                f"Address: {property_address or '—'}",
+                f"Property URL: {property_url or '—'}",
+                "Message:",
+                message or "—",
+            ]
+            lead_vals = {
+                "name": f"Website Inquiry: {property.name}",
+                "partner_id": partner.id,
+                "email_from": email or False,
+                "phone": phone or False,
+                "user_id": property.user_id.id if property.user_id else False,
+                "description": "\n".join(description_lines),
+            }
+            if "type" in Lead._fields:
+                lead_vals["type"] = "opportunity"
+            if stage:
+                lead_vals["stage_id"] = stage.id
+            lead = Lead.create(lead_vals)
+            lead.message_post(
+                body=body,
+                message_type="comment",
+                subtype_xmlid="mail.mt_comment",
+                author_id=partner.id,
+                email_from=email or False,
+                partner_ids=partner_ids,
+            )
+
+        salesperson_email = salesperson_partner.email if salesperson_partner else False
+        sender_email = (
+            property.company_id.email or self.env.company.email or email or False
+        )
+        if salesperson_email:
+            # Queued only: the mail queue cron talks to the SMTP server.
+            self.env["mail.mail"].sudo().create(
+                {
+                    "subject": f"New website inquiry: {property.name}",
+                    "body_html": body,
+                    "email_to": salesperson_email,
+                    "email_from": (
+                        f"Notifications <{sender_email}>" if sender_email else False
+                    ),
+                    "auto_delete": True,
+                }
+            )
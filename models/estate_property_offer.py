@@ -1,11 +1,20 @@
 # -*- coding: utf-8 -*-
 
+import logging
+from collections import defaultdict
+
+from markupsafe import Markup
+
 from odoo import api, fields, models
 from odoo.exceptions import UserError
-from odoo.tools import float_compare
+from odoo.tools import SQL, float_compare
+from odoo.tools.sql import create_index
 from dateutil.relativedelta import relativedelta
 
 
+_logger = logging.getLogger(__name__)
+
+
 class EstatePropertyOffer(models.Model):
     """
     Offers made on properties.
@@ -68,6 +77,7 @@ class EstatePropertyOffer(models.Model):
         string="Property",
         required=True,
         ondelete="cascade",
+        index=True,
     )
     
     # Related fields for convenience
@@ -78,6 +88,15 @@ class EstatePropertyOffer(models.Model):
         store=True,
     )
     
+    def init(self):
+        # Backs the expiry sweep: pending offers past their deadline.
+        create_index(
+            self.env.cr,
+            "estate_property_offer_state_deadline_index",
+            self._table,
+            ["state", "date_deadline"],
+        )
+
     # ----------------------------------------
     # Compute Methods
     # ----------------------------------------
@@ -103,32 +122,55 @@ class EstatePropertyOffer(models.Model):
     
     @api.model_create_multi
     def create(self, vals_list):
+        property_ids = {vals["property_id"] for vals in vals_list if vals.get("property_id")}
+        properties = self.env["estate.property"].browse(property_ids)
+        # Serialize offers on a property: without the lock, two concurrent
+        # offers could both pass the "higher than the best offer" check.
+        properties._lock_for_update()
+        # One aggregated max per property (the stored best_price), read before
+        # the batch: like one-by-one validation, each offer must beat the
+        # existing offers, whatever the order of the batch.
+        best_prices = {property_obj.id: property_obj.best_price for property_obj in properties}
         for vals in vals_list:
             property_id = vals.get("property_id")
-            if property_id:
-                property_obj = self.env["estate.property"].browse(property_id)
-                
-                # Check if property accepts offers
-                if property_obj.state in ("sold", "canceled"):
-                    raise UserError(
-                        f"Cannot create offer: Property '{property_obj.name}' is {property_obj.state}."
-                    )
-                
-                # Check if offer is higher than existing offers
-                if property_obj.offer_ids:
-                    max_offer = max(property_obj.offer_ids.mapped("price"))
-                    if float_compare(vals.get("price", 0), max_offer, precision_digits=2) <= 0:
-                        raise UserError(
-                            f"The offer must be higher than {max_offer:.2f}"
-                        )
-                
-                # Update property state
-                property_obj.state = "offer_received"
-                stage_id = property_obj._get_stage_id("stage_offer")
-                if stage_id:
-                    property_obj.stage_id = stage_id
+            if not property_id:
+                continue
+            property_obj = properties.browse(property_id)
+            
+            # Check if property accepts offers
+            if property_obj.state in ("sold", "canceled"):
+                raise UserError(
+                    f"Cannot create offer: Property '{property_obj.name}' is {property_obj.state}."
+                )
+            if property_obj.state == "offer_accepted":
+                raise UserError(
+                    f"Cannot create offer: an offer has already been accepted for "
+                    f"property '{property_obj.name}'."
+                )
+            
+            # Check if offer is higher than existing offers
+            max_offer = best_prices[property_id]
+            if max_offer and float_compare(vals.get("price", 0), max_offer, precision_digits=2) <= 0:
+                raise UserError(
+                    f"The offer must be higher than {max_offer:.2f}"
+                )
         
-        return super().create(vals_list)
+        offers = super().create(vals_list)
+        # Update property state (and stage, see estate.property.write) with a
+        # single write for every property that actually changes.
+        properties.filtered(lambda p: p.state != "offer_received").write(
+            {"state": "offer_received"}
+        )
+        offers.property_id._invalidate_website_cache(touch=True)
+        return offers
+
+    def unlink(self):
+        properties = self.property_id
+        res = super().unlink()
+        # The best offer and offer count of the properties change: bump their
+        # write_date like offer creation does.
+        properties.exists()._invalidate_website_cache(touch=True)
+        return res
     
     # ----------------------------------------
     # Action Methods
@@ -137,27 +179,41 @@ class EstatePropertyOffer(models.Model):
     def action_accept(self):
         """Accept this offer."""
         for record in self:
+            # Lock the property first, then check the offers and the property
+            # as committed by concurrent acceptances.
+            record.property_id._lock_for_update()
+            record.invalidate_recordset(["state"])
+            if record.state != "pending":
+                raise UserError("Only pending offers can be accepted.")
             if record.property_id.state in ("sold", "canceled"):
                 raise UserError("This property is no longer available for offer acceptance.")
+            if self.search_count(
+                [
+                    ("property_id", "=", record.property_id.id),
+                    ("state", "=", "accepted"),
+                    ("id", "!=", record.id),
+                ],
+                limit=1,
+            ):
+                raise UserError("Another offer has already been accepted for this property.")
             
             # Refuse all other offers
-            other_offers = record.property_id.offer_ids.filtered(
-                lambda o: o.id != record.id and o.state == "pending"
-            )
+            other_offers = self.search([
+                ("property_id", "=", record.property_id.id),
+                ("state", "=", "pending"),
+                ("id", "!=", record.id),
+            ])
             other_offers.action_refuse()
             
             # Update offer state
             record.state = "accepted"
             
-            # Update property
-            record.property_id.write({
-                "state": "offer_accepted",
-                "selling_price": record.price,
-                "buyer_id": record.partner_id.id,
-            })
-            stage_id = record.property_id._get_stage_id("stage_under_contract")
-            if stage_id:
-                record.property_id.stage_id = stage_id
+            # Update property (and its stage) in one write
+            record.property_id._write_state(
+                "offer_accepted",
+                selling_price=record.price,
+                buyer_id=record.partner_id.id,
+            )
         
         return True
     
@@ -174,3 +230,73 @@ class EstatePropertyOffer(models.Model):
         for record in self:
             record.state = "pending"
         return True
+
+    # ----------------------------------------
+    # Business Methods
+    # ----------------------------------------
+
+    @api.model
+    def _cron_expire_offers(self, batch_size=1000):
+        """Refuse the pending offers whose deadline has passed, in batches.
+
+        Each batch locks the ``batch_size`` oldest expired offers, skipping
+        those locked by another transaction, refuses them and posts one note
+        per property. Every batch is committed through the cron progress: an
+        interrupted sweep resumes where it stopped, and a sweep out of time
+        continues in a new run.
+        """
+        today = fields.Date.context_today(self)
+        total = 0
+        while True:
+            self.env.cr.execute(SQL(
+                """
+                SELECT id
+                  FROM estate_property_offer
+                 WHERE state = 'pending' AND date_deadline < %s
+                 ORDER BY date_deadline, id
+                 LIMIT %s
+                 FOR UPDATE SKIP LOCKED
+                """,
+                today,
+                batch_size,
+            ))
+            rows = self.env.cr.fetchall()
+            if not rows:
+                break
+            offers = self.browse([row[0] for row in rows])
+            offers.write({"state": "refused"})
+            offers._notify_expired()
+            total += len(offers)
+            if not self.env["ir.cron"]._commit_progress(len(offers)):
+                cron = self.env.ref(
+                    "hexclad_estate.ir_cron_expire_estate_offers", raise_if_not_found=False
+                )
+                if cron:
+                    cron.sudo()._trigger()
+                break
+            self.env.invalidate_all()
+        if total:
+            _logger.info("Refused %s expired offers", total)
+
+    def _notify_expired(self):
+        """Post one note per property listing its expired offers."""
+        offers_by_property = defaultdict(lambda: self.browse())
+        expired = self.sudo()
+        expired.fetch(["price", "date_deadline", "partner_id", "property_id"])
+        for offer in expired:
+            offers_by_property[offer.property_id] |= offer
+        for property_obj, offers in offers_by_property.items():
+            items = Markup("").join(
+                Markup("<li>%s: %s (deadline %s)</li>")
+                % (
+                    offer.partner_id.display_name,
+                    f"{offer.price:,.2f}",
+                    offer.date_deadline,
+                )
+                for offer in offers.sorted("price", reverse=True)
+            )
+            property_obj.message_post(
+                body=Markup("<p>%s</p><ul>%s</ul>")
+                % (f"{len(offers)} expired offer(s) automatically refused:", items),
+                subtype_xmlid="mail.mt_note",
+            )
@@ -1,6 +1,17 @@
 # -*- coding: utf-8 -*-
 
-from odoo import fields, models
+from odoo import api, fields, models
+from odoo.tools import frozendict, ormcache
+
+
+# Workflow state -> XML ID of the stage a property moves to in that state.
+STATE_STAGE_XML_IDS = {
+    "new": "stage_new",
+    "offer_received": "stage_offer",
+    "offer_accepted": "stage_under_contract",
+    "sold": "stage_won",
+    "canceled": "stage_lost",
+}
 
 
 class EstatePropertyStage(models.Model):
@@ -32,7 +43,56 @@ class EstatePropertyStage(models.Model):
     )
 
     def _compute_property_count(self):
+        counts = {
+            stage.id: count
+            for stage, count in self.env['estate.property']._read_group(
+                [('stage_id', 'in', self.ids)], ['stage_id'], ['__count']
+            )
+        }
         for stage in self:
-            stage.property_count = self.env['estate.property'].search_count([
-                ('stage_id', '=', stage.id)
-            ])
+            stage.property_count = counts.get(stage.id, 0)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        stages = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return stages
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
+
+    @api.model
+    @ormcache()
+    def _get_state_stage_map(self):
+        """Return the read-only ``{state: stage id}`` map of the workflow stages.
+
+        Built once per registry and shared by every user; stage creation and
+        deletion clear it, as do ``ir.model.data`` writes and deletions (which
+        clear the registry cache themselves). States whose stage is missing
+        are left out.
+        """
+        IrModelData = self.env["ir.model.data"].sudo()
+        stage_ids = {}
+        for state, xml_id in STATE_STAGE_XML_IDS.items():
+            res_id = IrModelData._xmlid_to_res_id(
+                f"hexclad_estate.{xml_id}", raise_if_not_found=False
+            )
+            if res_id:
+                stage_ids[state] = res_id
+        existing_ids = set(self.sudo().browse(stage_ids.values()).exists().ids)
+        return frozendict(
+            {state: stage_id for state, stage_id in stage_ids.items() if stage_id in existing_ids}
+        )
+
+    @api.model
+    def _get_stage_id_for_state(self, state):
+        """Return the stage ID for a property state, or False."""
+        return self._get_state_stage_map().get(state, False)
+
+    @api.model
+    def _get_default_stage_ids(self):
+        """Return the workflow stage IDs in state order."""
+        stage_map = self._get_state_stage_map()
+        return [stage_map[state] for state in STATE_STAGE_XML_IDS if state in stage_map]
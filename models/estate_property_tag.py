@@ -43,7 +43,37 @@ class EstatePropertyTag(models.Model):
     # ----------------------------------------
     
     def _compute_property_count(self):
+        counts = {
+            tag.id: count
+            for tag, count in self.env["estate.property"]._read_group(
+                [("tag_ids", "in", self.ids)], ["tag_ids"], ["__count"]
+            )
+        }
         for record in self:
-            record.property_count = self.env["estate.property"].search_count([
-                ("tag_ids", "in", record.id)
-            ])
+            record.property_count = counts.get(record.id, 0)
+
+    # ----------------------------------------
+    # CRUD Methods
+    # ----------------------------------------
+
+    def write(self, vals):
+        res = super().write(vals)
+        if "name" in vals:
+            # Tag names are part of the properties' full-text search vector.
+            self._get_tagged_properties()._update_search_vector()
+        return res
+
+    def unlink(self):
+        properties = self._get_tagged_properties()
+        res = super().unlink()
+        properties._update_search_vector()
+        return res
+
+    # ----------------------------------------
+    # Business Methods
+    # ----------------------------------------
+
+    def _get_tagged_properties(self):
+        return self.env["estate.property"].with_context(active_test=False).search(
+            [("tag_ids", "in", self.ids)]
+        )
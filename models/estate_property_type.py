@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from odoo import api, fields, models
+from odoo import fields, models
 
 
 class EstatePropertyType(models.Model):
@@ -40,14 +40,9 @@ class EstatePropertyType(models.Model):
     )
     
     # Computed fields for stat buttons
-    offer_ids = fields.Many2many(
-        "estate.property.offer",
-        string="Offers",
-        compute="_compute_offer",
-    )
     offer_count = fields.Integer(
         string="Offers Count",
-        compute="_compute_offer",
+        compute="_compute_offer_count",
     )
     property_count = fields.Integer(
         string="Properties Count",
@@ -58,17 +53,25 @@ class EstatePropertyType(models.Model):
     # Compute Methods
     # ----------------------------------------
     
-    @api.depends("property_ids.offer_ids")
-    def _compute_offer(self):
+    def _compute_offer_count(self):
+        counts = {
+            property_type.id: count
+            for property_type, count in self.env["estate.property.offer"]._read_group(
+                [("property_type_id", "in", self.ids)], ["property_type_id"], ["__count"]
+            )
+        }
         for record in self:
-            offers = record.property_ids.mapped("offer_ids")
-            record.offer_ids = offers
-            record.offer_count = len(offers)
+            record.offer_count = counts.get(record.id, 0)
     
-    @api.depends("property_ids")
     def _compute_property_count(self):
+        counts = {
+            property_type.id: count
+            for property_type, count in self.env["estate.property"]._read_group(
+                [("property_type_id", "in", self.ids)], ["property_type_id"], ["__count"]
+            )
+        }
         for record in self:
-            record.property_count = len(record.property_ids)
+            record.property_count = counts.get(record.id, 0)
     
     # ----------------------------------------
     # Action Methods
@@ -81,7 +84,7 @@ class EstatePropertyType(models.Model):
             "type": "ir.actions.act_window",
             "name": f"Offers for {self.name}",
             "res_model": "estate.property.offer",
-            "view_mode": "tree,form",
+            "view_mode": "list,form",
             "domain": [("property_type_id", "=", self.id)],
             "context": {"default_property_type_id": self.id},
         }
@@ -93,7 +96,7 @@ class EstatePropertyType(models.Model):
             "type": "ir.actions.act_window",
             "name": f"{self.name} Properties",
             "res_model": "estate.property",
-            "view_mode": "tree,form,kanban",
+            "view_mode": "list,form,kanban",
             "domain": [("property_type_id", "=", self.id)],
             "context": {"default_property_type_id": self.id},
         }
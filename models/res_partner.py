@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+from odoo import api, models
+from odoo.tools import SQL
+from odoo.tools.sql import create_index
+
+
+class ResPartner(models.Model):
+    """
+    Extend res.partner with an indexed, case-insensitive email lookup used to
+    match website inquiries to existing contacts.
+    """
+
+    _inherit = "res.partner"
+
+    def init(self):
+        super().init()
+        # ``=ilike`` cannot use a btree index; this one backs the equality on
+        # lower(email) in _find_or_create_inquiry_partner.
+        create_index(
+            self.env.cr,
+            "res_partner_estate_lower_email_index",
+            self._table,
+            ["lower(email)"],
+        )
+
+    # ----------------------------------------
+    # Business Methods
+    # ----------------------------------------
+
+    @api.model
+    def _find_or_create_inquiry_partner(self, name, email=False, phone=False):
+        """Return the active partner whose email matches case-insensitively,
+        creating it when there is none.
+
+        Lookups on the same normalized email are serialized with a transaction
+        level advisory lock, so concurrent inquiries from one visitor cannot
+        both miss and create duplicate partners.
+        """
+        email_key = (email or "").strip().lower()
+        partner = self.browse()
+        if email_key:
+            self.env.cr.execute(SQL(
+                "SELECT pg_advisory_xact_lock(hashtext(%s))",
+                f"hexclad_estate.inquiry_partner:{email_key}",
+            ))
+            self.flush_model(["email", "active"])
+            self.env.cr.execute(SQL(
+                "SELECT id FROM res_partner WHERE lower(email) = %s AND active ORDER BY id LIMIT 1",
+                email_key,
+            ))
+            row = self.env.cr.fetchone()
+            partner = self.browse(row[0]) if row else partner
+        if not partner:
+            return self.create(
+                {
+                    "name": name,
+                    "email": email or False,
+                    "phone": phone or False,
+                }
+            )
+        if phone and not partner.phone:
+            partner.phone = phone
+        return partner
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+
+from . import test_estate_property_offer
+from . import test_estate_property_search
+from . import test_offer_concurrency
+from . import test_pipeline_rollup
+from . import test_website_listing
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+from dateutil.relativedelta import relativedelta
+
+from odoo import fields
+from odoo.exceptions import UserError
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged("post_install", "-at_install")
+class TestEstatePropertyOffer(TransactionCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, tracking_disable=True))
+        cls.buyer = cls.env["res.partner"].create({"name": "Offer Buyer"})
+        cls.property = cls.env["estate.property"].create(
+            {"name": "Offer Property", "expected_price": 200000}
+        )
+
+    def _offer_vals(self, price, property_obj=None):
+        return {
+            "property_id": (property_obj or self.property).id,
+            "partner_id": self.buyer.id,
+            "price": price,
+        }
+
+    def test_batch_is_validated_against_existing_offers(self):
+        """Offers of one batch do not have to beat each other, as when
+        created one by one before the batch is committed."""
+        offers = self.env["estate.property.offer"].create(
+            [self._offer_vals(200000), self._offer_vals(150000)]
+        )
+        self.assertEqual(len(offers), 2)
+        self.assertEqual(self.property.best_price, 200000)
+        self.assertEqual(self.property.offer_count, 2)
+        self.assertEqual(self.property.state, "offer_received")
+
+    def test_batch_must_beat_existing_offers(self):
+        self.env["estate.property.offer"].create(self._offer_vals(180000))
+        with self.assertRaises(UserError):
+            self.env["estate.property.offer"].create(
+                [self._offer_vals(250000), self._offer_vals(170000)]
+            )
+
+    def test_batch_over_several_properties(self):
+        other = self.env["estate.property"].create(
+            {"name": "Other Offer Property", "expected_price": 100000}
+        )
+        self.env["estate.property.offer"].create(self._offer_vals(90000, other))
+        self.env["estate.property.offer"].create(
+            [
+                self._offer_vals(95000, other),
+                self._offer_vals(190000),
+                self._offer_vals(92000, other),
+            ]
+        )
+        self.assertEqual(other.best_price, 95000)
+        self.assertEqual(other.offer_count, 3)
+        self.assertEqual(self.property.best_price, 190000)
+        self.assertEqual((self.property | other).mapped("state"), ["offer_received"] * 2)
+
+    def test_accept_after_new_bid(self):
+        first, second = self.env["estate.property.offer"].create(
+            [self._offer_vals(180000), self._offer_vals(170000)]
+        )
+        first.action_accept()
+        self.assertEqual(second.state, "refused")
+        self.assertEqual(self.property.state, "offer_accepted")
+
+        # The property is under contract: no new bid, and the refused offer
+        # cannot be accepted in place of the accepted one.
+        with self.assertRaisesRegex(UserError, "already been accepted"):
+            self.env["estate.property.offer"].create(self._offer_vals(250000))
+        with self.assertRaisesRegex(UserError, "Only pending offers"):
+            second.action_accept()
+        self.assertEqual(self.property.state, "offer_accepted")
+        self.assertEqual(self.property.selling_price, 180000)
+
+    def test_accept_checks_accepted_offers_whatever_the_state(self):
+        """The accepted offer guard does not rely on the property state, which
+        can be moved back by hand (e.g. from the property form)."""
+        first = self.env["estate.property.offer"].create(self._offer_vals(180000))
+        first.action_accept()
+        self.property.state = "offer_received"
+        late_bid = self.env["estate.property.offer"].create(self._offer_vals(190000))
+        with self.assertRaisesRegex(UserError, "already been accepted"):
+            late_bid.action_accept()
+        self.assertEqual(first.state, "accepted")
+        self.assertEqual(late_bid.state, "pending")
+        self.assertEqual(self.property.selling_price, 180000)
+
+    def test_cron_expires_offers_past_deadline(self):
+        other = self.env["estate.property"].create(
+            {"name": "Other Expiring Property", "expected_price": 100000}
+        )
+        offers = self.env["estate.property.offer"].create(
+            [
+                self._offer_vals(190000),
+                self._offer_vals(195000),
+                self._offer_vals(198000),
+                self._offer_vals(92000, other),
+            ]
+        )
+        expired = offers - offers[2]
+        expired.date_deadline = fields.Date.context_today(self.env.user) - relativedelta(days=1)
+
+        # Batches smaller than a property's expired offers still finish the sweep.
+        self.env["estate.property.offer"]._cron_expire_offers(batch_size=2)
+
+        self.assertEqual(offers.mapped("state"), ["refused", "refused", "pending", "refused"])
+        for property_obj in (self.property, other):
+            notes = self.env["mail.message"].search(
+                [
+                    ("model", "=", "estate.property"),
+                    ("res_id", "=", property_obj.id),
+                    ("body", "ilike", "automatically refused"),
+                ]
+            )
+            self.assertTrue(notes, f"No expiry note on {property_obj.name}")
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged("post_install", "-at_install")
+class TestEstatePropertySearch(TransactionCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.tag = cls.env["estate.property.tag"].create({"name": "Waterfront"})
+        cls.property = cls.env["estate.property"].create(
+            {"name": "Search Property", "expected_price": 100000, "tag_ids": [(6, 0, cls.tag.ids)]}
+        )
+
+    def _search_keyword(self, text):
+        return self.env["estate.property"].search([("fulltext", "=", text)])
+
+    def test_tag_rename_updates_search(self):
+        self.assertIn(self.property, self._search_keyword("waterfront"))
+        self.tag.name = "Lakeside"
+        self.assertNotIn(self.property, self._search_keyword("waterfront"))
+        self.assertIn(self.property, self._search_keyword("lakeside"))
+
+    def test_tag_unlink_updates_search(self):
+        self.tag.unlink()
+        self.assertNotIn(self.property, self._search_keyword("waterfront"))
+        self.assertIn(self.property, self._search_keyword("search property"))
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+from contextlib import contextmanager
+
+from odoo import SUPERUSER_ID, api
+from odoo.exceptions import UserError
+from odoo.modules.registry import Registry
+from odoo.tests.common import BaseCase, get_db_name, tagged
+
+
+@tagged("post_install", "-at_install")
+class TestOfferConcurrency(BaseCase):
+    """Offer acceptance from two concurrent transactions.
+
+    The transactions need their own database connections, so this case runs
+    outside the test transaction: every cursor commits, and the created
+    records are deleted at the end.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.registry = Registry(get_db_name())
+        with self._environment() as env:
+            buyer = env["res.partner"].create({"name": "Concurrent Buyer"})
+            property_obj = env["estate.property"].create(
+                {"name": "Concurrent Property", "expected_price": 100000}
+            )
+            offers = env["estate.property.offer"].create(
+                [
+                    {"property_id": property_obj.id, "partner_id": buyer.id, "price": 95000},
+                    {"property_id": property_obj.id, "partner_id": buyer.id, "price": 97000},
+                ]
+            )
+            self.buyer_id, self.property_id, self.offer_ids = buyer.id, property_obj.id, offers.ids
+        self.addCleanup(self._cleanup)
+
+    @contextmanager
+    def _environment(self):
+        """Yield an environment on a new cursor, committed at the end."""
+        with self.registry.cursor() as cr:
+            yield api.Environment(cr, SUPERUSER_ID, {"tracking_disable": True})
+
+    def _cleanup(self):
+        with self._environment() as env:
+            property_obj = env["estate.property"].browse(self.property_id)
+            property_obj.action_cancel()
+            property_obj.unlink()
+            env["res.partner"].browse(self.buyer_id).unlink()
+
+    def test_concurrent_accepts_only_one_wins(self):
+        first_offer_id, second_offer_id = self.offer_ids
+        with self._environment() as env1, self._environment() as env2:
+            env1["estate.property.offer"].browse(first_offer_id).action_accept()
+            # The first acceptance holds the property row until it commits:
+            # the second fails at once instead of waiting or racing it.
+            with self.assertRaisesRegex(UserError, "being updated by someone else"):
+                env2["estate.property.offer"].browse(second_offer_id).action_accept()
+
+        # Once the first acceptance is committed, a retry sees the second
+        # offer refused by it.
+        with self._environment() as env:
+            with self.assertRaisesRegex(UserError, "Only pending offers"):
+                env["estate.property.offer"].browse(second_offer_id).action_accept()
+
+        with self._environment() as env:
+            offers = env["estate.property.offer"].browse(self.offer_ids)
+            self.assertEqual(offers.mapped("state"), ["accepted", "refused"])
+            property_obj = env["estate.property"].browse(self.property_id)
+            self.assertEqual(property_obj.state, "offer_accepted")
+            self.assertEqual(property_obj.selling_price, 95000)
+            self.assertEqual(property_obj.buyer_id.id, self.buyer_id)
+
+    def test_concurrent_offers_second_fails_fast(self):
+        with self._environment() as env1, self._environment() as env2:
+            env1["estate.property.offer"].create(
+                {"property_id": self.property_id, "partner_id": self.buyer_id, "price": 99000}
+            )
+            # The first offer holds the property row until it commits: the
+            # second cannot be validated against it, so it fails at once.
+            with self.assertRaisesRegex(UserError, "being updated by someone else"):
+                env2["estate.property.offer"].create(
+                    {"property_id": self.property_id, "partner_id": self.buyer_id, "price": 98000}
+                )
+
+        with self._environment() as env:
+            property_obj = env["estate.property"].browse(self.property_id)
+            self.assertEqual(property_obj.offer_count, 3)
+            self.assertEqual(property_obj.best_price, 99000)
+
+    def test_bid_after_committed_accept(self):
+        first_offer_id, _second_offer_id = self.offer_ids
+        with self._environment() as env:
+            env["estate.property.offer"].browse(first_offer_id).action_accept()
+
+        with self._environment() as env:
+            with self.assertRaisesRegex(UserError, "already been accepted"):
+                env["estate.property.offer"].create(
+                    {"property_id": self.property_id, "partner_id": self.buyer_id, "price": 120000}
+                )
+
+        with self._environment() as env:
+            property_obj = env["estate.property"].browse(self.property_id)
+            self.assertEqual(property_obj.state, "offer_accepted")
+            self.assertEqual(property_obj.offer_count, 2)
+            self.assertEqual(property_obj.selling_price, 95000)
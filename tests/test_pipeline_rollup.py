@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged("post_install", "-at_install")
+class TestPipelineRollup(TransactionCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Rollup = cls.env["estate.pipeline.rollup"]
+        cls.property_type = cls.env["estate.property.type"].create({"name": "Rollup Type"})
+        cls.properties = cls.env["estate.property"].create(
+            [
+                {
+                    "name": f"Rollup Property {index}",
+                    "expected_price": 100000,
+                    "property_type_id": cls.property_type.id,
+                }
+                for index in range(3)
+            ]
+        )
+
+    def _type_totals(self):
+        rows = self.Rollup.search([("property_type_id", "=", self.property_type.id)])
+        return sum(rows.mapped("property_count")), sum(rows.mapped("expected_price"))
+
+    def test_incremental_refresh(self):
+        self.Rollup._refresh(full=True)
+        self.assertEqual(self._type_totals(), (3, 300000))
+
+        self.properties[0].expected_price = 150000
+        self.properties[1].unlink()
+        self.Rollup._refresh()
+        self.assertEqual(self._type_totals(), (2, 250000))
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+from unittest.mock import patch
+
+from odoo.tests import HttpCase, tagged
+
+from odoo.addons.hexclad_estate.controllers import estate_property as estate_controller
+
+LISTING_PAGE_SIZE = 100
+# Queries a larger page may add over a single-card page. Far below one per
+# card, so any lazy per-card read (image, type, state label) fails the test.
+LISTING_QUERY_SLACK = 3
+
+
+@tagged("post_install", "-at_install")
+class TestWebsiteListing(HttpCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        property_types = cls.env["estate.property.type"].create(
+            [{"name": f"Listing Type {index}"} for index in range(10)]
+        )
+        properties = cls.env["estate.property"].create(
+            [
+                {
+                    "name": f"Listing Property {index}",
+                    "expected_price": 100000 + index,
+                    "city": f"City {index % 7}",
+                    "property_type_id": property_types[index % len(property_types)].id,
+                    "is_published": True,
+                }
+                for index in range(LISTING_PAGE_SIZE + 1)
+            ]
+        )
+        cls.env["estate.property.image"].create(
+            [
+                {"name": f"Photo {sequence}", "property_id": property_obj.id, "sequence": sequence}
+                for property_obj in properties
+                for sequence in (1, 2)
+            ]
+        )
+
+    def _get_listing(self, page_size):
+        with patch.object(estate_controller, "PROPERTIES_PER_PAGE", page_size):
+            response = self.url_open("/properties")
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def _count_listing_queries(self, page_size):
+        self._get_listing(page_size)  # warm the registry and template caches
+        start = self.cr.sql_log_count
+        self._get_listing(page_size)
+        return self.cr.sql_log_count - start
+
+    def test_listing_query_count_does_not_grow_with_cards(self):
+        """A 100-card page runs no more queries than a single-card page."""
+        single_card_queries = self._count_listing_queries(1)
+        self._get_listing(LISTING_PAGE_SIZE)
+        with self.assertQueryCount(single_card_queries + LISTING_QUERY_SLACK):
+            response = self._get_listing(LISTING_PAGE_SIZE)
+        self.assertEqual(response.text.count("estate-property-listing-image"), LISTING_PAGE_SIZE)
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+import math
+import re
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = EARTH_RADIUS_KM * math.pi / 180
+
+GEOHASH_PRECISION = 9
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def normalize_postcode(value):
+    """Return ``value`` upper-cased without spaces, or an empty string."""
+    return re.sub(r"\s+", "", value or "").upper()
+
+
+def geohash_encode(latitude, longitude, precision=GEOHASH_PRECISION):
+    """Encode a point as a geohash of ``precision`` characters."""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        if even:
+            value, interval = longitude, lon_range
+        else:
+            value, interval = latitude, lat_range
+        middle = (interval[0] + interval[1]) / 2
+        bits <<= 1
+        if value >= middle:
+            bits |= 1
+            interval[0] = middle
+        else:
+            interval[1] = middle
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def geohash_cell_size(precision):
+    """Return the ``(height, width)`` in degrees of a geohash cell."""
+    lon_bits = math.ceil(precision * 5 / 2)
+    lat_bits = precision * 5 - lon_bits
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lon_bits
+
+
+def geohash_cover(south, west, north, east, max_cells=16):
+    """Return the geohash prefixes covering a bounding box.
+
+    The finest precision whose covering has at most ``max_cells`` cells is
+    used, so a prefix match on them is a handful of index range scans. A box
+    with ``west > east`` crosses the antimeridian. Returns an empty list when
+    even a single-character covering is larger than ``max_cells``.
+    """
+    if west > east:
+        boxes = [(south, west, north, 180.0), (south, -180.0, north, east)]
+    else:
+        boxes = [(south, west, north, east)]
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = geohash_cell_size(precision)
+        cells = set()
+        for box_south, box_west, box_north, box_east in boxes:
+            rows = _cell_range(box_south, box_north, -90.0, height)
+            columns = _cell_range(box_west, box_east, -180.0, width)
+            if len(rows) * len(columns) + len(cells) > max_cells:
+                break
+            for row in rows:
+                for column in columns:
+                    cells.add(
+                        geohash_encode(
+                            -90.0 + (row + 0.5) * height,
+                            -180.0 + (column + 0.5) * width,
+                            precision,
+                        )
+                    )
+        else:
+            return sorted(cells)
+    return []
+
+
+def _cell_range(low, high, origin, size):
+    last = round((-origin * 2) / size) - 1
+    first = min(max(int((low - origin) // size), 0), last)
+    stop = min(max(int((high - origin) // size), 0), last)
+    return range(first, stop + 1)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance between two points, in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bbox_around(latitude, longitude, radius_km):
+    """Return the ``(south, west, north, east)`` box enclosing a circle.
+
+    Longitudes wrap around the antimeridian (``west > east``); near the poles
+    the box spans every longitude.
+    """
+    dlat = radius_km / KM_PER_DEGREE
+    south = max(latitude - dlat, -90.0)
+    north = min(latitude + dlat, 90.0)
+    cos_lat = math.cos(math.radians(latitude))
+    if south <= -90.0 or north >= 90.0 or cos_lat <= 0:
+        return south, -180.0, north, 180.0
+    dlon = dlat / cos_lat
+    if dlon >= 180.0:
+        return south, -180.0, north, 180.0
+    west = longitude - dlon
+    east = longitude + dlon
+    if west < -180.0:
+        west += 360.0
+    if east > 180.0:
+        east -= 360.0
+    return south, west, north, east
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from collections import Counter, OrderedDict
+
+
+def parse_rate(value, default):
+    """Parse a ``"<burst>/<seconds>"`` rate into ``(capacity, refill per second)``.
+
+    Returns None when the rate is disabled (``0`` or empty) and ``default`` when
+    the value cannot be parsed.
+    """
+    value = (value or "").strip()
+    if value in ("", "0"):
+        return None
+    try:
+        capacity, period = (float(part) for part in value.split("/", 1))
+    except ValueError:
+        return default
+    if capacity <= 0 or period <= 0:
+        return default
+    return capacity, capacity / period
+
+
+class TokenBucketLimiter:
+    """In-process token buckets, one per key.
+
+    Each bucket holds up to ``capacity`` tokens and refills continuously at
+    ``refill_rate`` tokens per second; a request spends one token or is
+    rejected. Only the ``max_keys`` most recently used buckets are kept, so
+    memory stays bounded under a flood of distinct clients. Buckets are per
+    worker process: with N workers the effective limit is up to N times higher.
+    """
+
+    def __init__(self, max_keys=10000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+        self.allowed = Counter()
+        self.rejected = Counter()
+
+    def consume(self, key, capacity, refill_rate):
+        """Spend a token from ``key``'s bucket.
+
+        Returns ``0`` when allowed, otherwise the number of seconds until a
+        token becomes available. The first item of ``key`` names its scope in
+        the counters.
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * refill_rate)
+            if tokens >= 1:
+                tokens -= 1
+                retry_after = 0
+                self.allowed[key[0]] += 1
+            else:
+                retry_after = (1 - tokens) / refill_rate
+                self.rejected[key[0]] += 1
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return retry_after
+
+    def stats(self):
+        with self._lock:
+            return {
+                "buckets": len(self._buckets),
+                "allowed": dict(self.allowed),
+                "rejected": dict(self.rejected),
+            }
+
+
+# Limits POSTs to the public inquiry endpoint, per client IP and per property.
+inquiry_limiter = TokenBucketLimiter()
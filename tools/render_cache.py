@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRURenderCache:
+    """Bounded, thread-safe LRU cache of rendered HTML fragments.
+
+    Keys are tuples whose first two items are the database name and the
+    property id, so every entry of a property can be evicted at once. Entries
+    older than ``ttl`` seconds are treated as misses, which bounds staleness for
+    changes made through another worker process.
+    """
+
+    def __init__(self, max_size=512, ttl=300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._keys_by_record = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl:
+                self._discard(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._entries[key] = (time.monotonic(), value)
+            self._keys_by_record.setdefault(key[:2], set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, dbname, record_ids):
+        with self._lock:
+            for record_id in record_ids:
+                for key in self._keys_by_record.pop((dbname, record_id), ()):
+                    self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_record.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _discard(self, key):
+        self._entries.pop(key, None)
+        keys = self._keys_by_record.get(key[:2])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_record[key[:2]]
+
+
+# Rendered body of public property detail pages, shared by all requests of
+# this worker process.
+detail_cache = LRURenderCache()
+# Listing facet counts per filter signature, shared by all requests of this
+# worker process. Counts may lag listing changes by up to ``ttl`` seconds.
+facet_cache = LRURenderCache(max_size=256, ttl=60)